@@ -0,0 +1,194 @@
+# Benchmark
+# Hack the Interview II - April 2020
+# ---------------------------------- Purpose -----------------------------------
+# Runs every method of every solution on every one of HackerRank's test cases,
+# checking the answers against the expected output and recording how long each
+# run took and how much memory it used, so that it's easy to tell whether an
+# optimization actually helps (especially on the multi-MB cases).
+# ---------------------------------- Solution ----------------------------------
+# Each solution lists its methods by name in METHODS, and python -m
+# hack_the_interview solve solves a test case with the method named after it.
+# The names are read from the source instead of importing it, so that NumPy
+# and the like aren't imported into this process.
+# Every run is a process of its own, so that a method that runs for too long
+# can be killed, and so that the peak memory (the largest resident set size,
+# from wait4) is that of only this run. Wall time includes starting Python, so
+# the parse, solve and write times the solution reports on stderr are recorded
+# too.
+#
+# Results are written to a JSON file as {problem: {input: {method: result}}}.
+# Given a baseline (the results of an earlier run), any method that got slower
+# by more than the tolerance, or that used to pass and doesn't anymore, is
+# reported as a regression and the exit status is 1.
+#
+# Usage:
+# python benchmark.py [--problems ...] [--methods ...] [--timeout SECONDS]
+#                     [--output FILE] [--baseline FILE] [--tolerance FRACTION]
+
+import argparse
+import ast
+import json
+import os
+import re
+import signal
+import subprocess
+import sys
+import time
+from tempfile import TemporaryFile
+from typing import Dict, List
+
+from hack_the_interview.checks import listCases
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+PROBLEMS = ['product-distribution', 'maximal-char-requests',
+            'configuring-project-management', 'minimum-string-coefficient']
+# Slowdowns smaller than this many seconds are noise, whatever the percentage
+MIN_REGRESSION = 0.05
+
+def listMethods(problem: str) -> List[str]:
+    """
+    Returns names of a solution's methods (the keys of its METHODS)
+    """
+    with open(os.path.join(ROOT, 'hack_the_interview',
+                           problem.replace('-', '_') + '.py')) as f:
+        tree = ast.parse(f.read())
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and \
+           any(getattr(target, 'id', None) == 'METHODS'
+               for target in node.targets):
+            return [key.value for key in node.value.keys]
+    return []
+
+def readAnswers(text: str) -> List[List[str]]:
+    """
+    Splits output into lines of answers, ignoring extra whitespace
+    """
+    lines = [line.split() for line in text.splitlines()]
+    while lines and not(lines[-1]):
+        lines.pop()
+    return lines
+
+def runMethod(problem: str, method: str, input_name: str,
+              timeout: float) -> Dict[str, object]:
+    """
+    Solves one test case with one method in a process of its own
+    """
+    input_name = os.path.join(ROOT, 'test-cases', problem, input_name)
+    output_name = input_name.replace('input', 'output')
+    # Outputs go to files so that a large one can't fill up a pipe and stall
+    # the run while it's being timed
+    with open(os.devnull, 'rb') as stdin, TemporaryFile() as stdout, \
+         TemporaryFile() as stderr:
+        start = time.perf_counter()
+        process = subprocess.Popen([sys.executable, '-m', 'hack_the_interview',
+                                    'solve', problem, input_name, method],
+                                   cwd=ROOT, stdin=stdin, stdout=stdout,
+                                   stderr=stderr)
+        deadline, timed_out = start + timeout, False
+        # Poll so that the process can be killed at the deadline and its
+        # resource usage still be collected
+        while True:
+            pid, status, usage = os.wait4(process.pid, os.WNOHANG)
+            if pid:
+                break
+            if time.perf_counter() > deadline:
+                process.send_signal(signal.SIGKILL)
+                pid, status, usage = os.wait4(process.pid, 0)
+                timed_out = True
+                break
+            time.sleep(0.005)
+        wall = time.perf_counter() - start
+        # Don't let Popen try to wait on a process that's already been reaped
+        process.returncode = os.waitstatus_to_exitcode(status)
+        stdout.seek(0)
+        stderr.seek(0)
+        output, errors = stdout.read().decode(), stderr.read().decode()
+    # ru_maxrss is in KB on Linux
+    result = {'wall': round(wall, 4), 'peak_kb': usage.ru_maxrss}
+    if timed_out:
+        result['status'] = 'timeout'
+    elif process.returncode:
+        result['status'] = 'error'
+        result['error'] = errors.strip().splitlines()[-1:] or \
+                          ['exit status {0}'.format(process.returncode)]
+    else:
+        with open(output_name) as f:
+            expected = readAnswers(f.read())
+        result['status'] = 'passed' if readAnswers(output) == expected else \
+                           'failed'
+    # Times the solution reported for each step
+    for name, t in re.findall(r'(\w+) ([\d.]+)s', errors):
+        result[name] = float(t)
+    return result
+
+def findRegressions(results: dict, baseline: dict,
+                    tolerance: float) -> List[str]:
+    """
+    Lists methods that got slower or stopped passing since the baseline
+    """
+    regressions = []
+    for problem, cases in results.items():
+        for input_name, methods in cases.items():
+            for method, result in methods.items():
+                before = baseline.get(problem, {}).get(input_name, {}).get(
+                         method)
+                if before is None or not(before['status'] == 'passed'):
+                    continue
+                name = '{0} {1} {2}'.format(problem, input_name, method)
+                if not(result['status'] == 'passed'):
+                    regressions.append('{0}: {1}, used to pass'.format(
+                                       name, result['status']))
+                    continue
+                # Compare the time spent solving when both runs reported it,
+                # since wall time includes starting Python
+                key = 'solve' if 'solve' in result and 'solve' in before else \
+                      'wall'
+                if result[key] > before[key] * (1 + tolerance) and \
+                   result[key] - before[key] > MIN_REGRESSION:
+                    regressions.append('{0}: {1} {2:.3f}s, was {3:.3f}s'.format(
+                                       name, key, result[key], before[key]))
+    return regressions
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks every method on "
+                                     "every test case")
+    parser.add_argument('--problems', nargs='+', choices=PROBLEMS,
+                        default=PROBLEMS)
+    parser.add_argument('--methods', nargs='+',
+                        help="only run methods with these names")
+    parser.add_argument('--timeout', type=float, default=10,
+                        help="seconds before a run is killed")
+    parser.add_argument('--output', default=os.path.join(ROOT,
+                        'benchmark.json'))
+    parser.add_argument('--baseline', help="results of an earlier run")
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help="fraction a method can slow down by")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for problem in args.problems:
+        methods = [method for method in listMethods(problem)
+                   if not(args.methods) or method in args.methods]
+        for input_name in listCases(problem):
+            for method in methods:
+                result = runMethod(problem, method, input_name, args.timeout)
+                results.setdefault(problem, {}).setdefault(input_name, {})[
+                    method] = result
+                print("{0:32} {1:12} {2:34} {3:8} {4:8.3f}s {5:8}KB".format(
+                      problem, input_name, method, result['status'],
+                      result['wall'], result['peak_kb']))
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = findRegressions(results, json.load(f),
+                                          args.tolerance)
+        for regression in regressions:
+            print("Regression: " + regression)
+        if regressions:
+            return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
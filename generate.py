@@ -0,0 +1,239 @@
+# Generate
+# Hack the Interview II - April 2020
+# ---------------------------------- Purpose -----------------------------------
+# HackerRank's largest test cases are only a few MB, which is too small to see
+# how the solutions scale, and Minimum String Coefficient has none at all. This
+# makes seeded random test cases of any size (10^5 - 10^8 and beyond) in either
+# the text format or the binary format of loader.py.
+# ---------------------------------- Solution ----------------------------------
+# Each problem's generator makes its test case a chunk at a time as NumPy 
+# arrays, and writes each chunk in the chosen format as soon as it's made, so 
+# that memory stays at one chunk however large the test case is.
+# The random numbers come from one seeded generator drawn in the same order for
+# both formats, so the same seed gives the same test case in either format.
+#
+# Shape of each problem's test case:
+# Product Distribution: how many integers, m and the range of the integers
+# Maximal Char Requests: how long the string is, how skewed the letters are
+# (letter i is 1 / (i + 1)^skew as likely as 'a', so 0 is uniform and larger
+# values make later letters rarer), how many are uppercase, how many queries
+# and how long they are on average
+# Configuring Project Management: how many students and friendships, and what
+# share of the friendships are with student 1 and with student 2
+# Minimum String Coefficient: how long the string is, p, and how long the runs
+# of 1s and 0s are on average (geometric, or heavy-tailed Pareto)
+#
+# With --expected, the answers are also written to a file by solving the test
+# case with the solution's default method, so that new cases can be used like
+# HackerRank's (e.g. by benchmark.py, as test-cases/<problem>/outputNN.txt).
+#
+# Usage:
+# python generate.py PROBLEM FILE [--seed SEED] [--binary] [--expected FILE]
+#                    [shape options, see python generate.py PROBLEM --help]
+
+import argparse
+import os
+import subprocess
+import sys
+from typing import IO, Iterator, List
+
+import numpy as np
+
+from hack_the_interview import loader
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+# How many integers, characters or bits are made at once
+CHUNK_SIZE = 2 ** 20
+
+def chunkSizes(total: int) -> Iterator[int]:
+    """
+    Splits total into chunks of at most CHUNK_SIZE
+    """
+    for start in range(0, total, CHUNK_SIZE):
+        yield min(CHUNK_SIZE, total - start)
+
+def writeText(f: IO[bytes], values: 'np.ndarray', per_line: int):
+    """
+    Writes integers separated by spaces, per_line to a line
+    """
+    line = ' '.join(['%d'] * per_line) + '\n'
+    f.write(((line * (len(values) // per_line)) %
+             tuple(values.tolist())).encode())
+
+def writeBinary(f: IO[bytes], values: 'np.ndarray', dtype: str = '<i8'):
+    """
+    Writes integers as little-endian binary
+    """
+    f.write(np.ascontiguousarray(values, dtype=dtype).tobytes())
+
+def generateProducts(f: IO[bytes], rng: np.random.Generator, binary: bool,
+                     n: int, m: int, low: int, high: int):
+    """
+    Writes a Product Distribution test case
+    """
+    if binary:
+        writeBinary(f, [n, m])
+    else:
+        f.write('{0} {1}\n'.format(n, m).encode())
+    for i, size in enumerate(chunkSizes(n)):
+        values = rng.integers(low, high, size=size, endpoint=True)
+        if binary:
+            writeBinary(f, values)
+        else:
+            # All of the integers are on one line
+            f.write(b' ' if i else b'')
+            f.write(' '.join(map(str, values.tolist())).encode())
+    if not(binary):
+        f.write(b'\n')
+
+def generateMaximalChar(f: IO[bytes], rng: np.random.Generator, binary: bool,
+                        n: int, skew: float, upper: float, q: int,
+                        query_length: float):
+    """
+    Writes a Maximal Char Requests test case
+    """
+    letters = np.frombuffer(b'abcdefghijklmnopqrstuvwxyz', dtype=np.uint8)
+    weights = 1 / np.arange(1, 27) ** skew
+    if binary:
+        writeBinary(f, [n])
+    else:
+        f.write('{0}\n'.format(n).encode())
+    for size in chunkSizes(n):
+        chars = rng.choice(letters, size=size, p=weights / weights.sum())
+        # Make some of them uppercase
+        chars = chars - 32 * (rng.random(size) < upper)
+        f.write(chars.astype(np.uint8).tobytes())
+    if binary:
+        writeBinary(f, [q])
+    else:
+        f.write('\n{0}\n'.format(q).encode())
+    for size in chunkSizes(q):
+        # Queries start anywhere and are about query_length long, but end
+        # before the end of the string
+        lower = rng.integers(0, max(n, 1), size=size)
+        lengths = rng.geometric(1 / max(query_length, 1), size=size)
+        upper_ends = np.minimum(lower + lengths - 1, n - 1)
+        queries = np.stack((lower, upper_ends), axis=1).ravel()
+        if binary:
+            writeBinary(f, queries, '<i4')
+        else:
+            writeText(f, queries, 2)
+
+def generateProjectManagement(f: IO[bytes], rng: np.random.Generator,
+                              binary: bool, n: int, m: int, ones_share: float,
+                              twos_share: float):
+    """
+    Writes a Configuring Project Management test case (with one case in it)
+    """
+    if binary:
+        writeBinary(f, [1, n, m])
+    else:
+        f.write('1\n{0} {1}\n'.format(n, m).encode())
+    for size in chunkSizes(m):
+        edges = rng.integers(1, n, size=(size, 2), endpoint=True)
+        # Make some of the friendships with student 1 or 2, on a random side
+        hub = rng.random(size)
+        hubs = np.where(hub < ones_share, 1,
+                        np.where(hub < ones_share + twos_share, 2, 0))
+        sides = rng.integers(0, 1, size=size, endpoint=True)
+        rows = np.flatnonzero(hubs)
+        edges[rows, sides[rows]] = hubs[rows]
+        if binary:
+            writeBinary(f, edges.ravel(), '<i4')
+        else:
+            writeText(f, edges.ravel(), 2)
+
+def generateStringCoeff(f: IO[bytes], rng: np.random.Generator, binary: bool,
+                        n: int, p: int, mean_run: float, heavy_tail: bool):
+    """
+    Writes a Minimum String Coefficient test case
+    """
+    if binary:
+        writeBinary(f, [n, p])
+    else:
+        f.write('{0} {1}\n'.format(n, p).encode())
+    # The first run's bit, and bits left over from the last chunk when packing
+    bit, carry, left = int(rng.integers(0, 1, endpoint=True)), \
+                       np.zeros(0, dtype=np.uint8), n
+    while left:
+        # Enough runs to very likely fill a chunk, cut down to what's left
+        count = max(1, int(CHUNK_SIZE / max(mean_run, 1)))
+        if heavy_tail:
+            # NumPy's Pareto with shape 2 has a mean of 1, so scale it up to 
+            # mean_run (runs are at least 1 long)
+            lengths = np.maximum(1, np.round(rng.pareto(2, size=count) * 
+                                             mean_run))
+        else:
+            lengths = rng.geometric(1 / max(mean_run, 1), size=count)
+        lengths = lengths.astype(np.int64)
+        bits = np.repeat((np.arange(count) + bit) % 2, lengths)[:left]
+        bits = bits.astype(np.uint8)
+        bit = (count + bit) % 2
+        left -= len(bits)
+        if binary:
+            # Only pack whole bytes until the end
+            bits = np.concatenate((carry, bits))
+            whole = len(bits) if not(left) else len(bits) // 8 * 8
+            f.write(np.packbits(bits[:whole]).tobytes())
+            carry = bits[whole:]
+        else:
+            f.write((bits + ord('0')).tobytes())
+    if not(binary):
+        f.write(b'\n')
+
+GENERATORS = {
+    'product-distribution': generateProducts,
+    'maximal-char-requests': generateMaximalChar,
+    'configuring-project-management': generateProjectManagement,
+    'minimum-string-coefficient': generateStringCoeff
+}
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description="Generates a random test "
+                                     "case")
+    problems = parser.add_subparsers(dest='problem', required=True)
+    shapes = {name: problems.add_parser(name) for name in GENERATORS}
+    for name, shape in shapes.items():
+        shape.add_argument('file')
+        shape.add_argument('--seed', type=int, default=0)
+        shape.add_argument('--binary', action='store_true',
+                           help="write the binary format of loader.py")
+        shape.add_argument('--expected', help="also write the answers here")
+    shape = shapes['product-distribution']
+    shape.add_argument('--n', type=int, default=10 ** 5)
+    shape.add_argument('--m', type=int, default=10)
+    shape.add_argument('--low', type=int, default=1)
+    shape.add_argument('--high', type=int, default=10 ** 9)
+    shape = shapes['maximal-char-requests']
+    shape.add_argument('--n', type=int, default=10 ** 5)
+    shape.add_argument('--skew', type=float, default=0)
+    shape.add_argument('--upper', type=float, default=0.5)
+    shape.add_argument('--q', type=int, default=10 ** 5)
+    shape.add_argument('--query-length', type=float, default=1000)
+    shape = shapes['configuring-project-management']
+    shape.add_argument('--n', type=int, default=10 ** 5)
+    shape.add_argument('--m', type=int, default=10 ** 5)
+    shape.add_argument('--ones-share', type=float, default=0.01)
+    shape.add_argument('--twos-share', type=float, default=0.01)
+    shape = shapes['minimum-string-coefficient']
+    shape.add_argument('--n', type=int, default=10 ** 5)
+    shape.add_argument('--p', type=int, default=10)
+    shape.add_argument('--mean-run', type=float, default=4)
+    shape.add_argument('--heavy-tail', action='store_true')
+    args = vars(parser.parse_args(argv))
+
+    problem, file_name = args.pop('problem'), args.pop('file')
+    seed, expected = args.pop('seed'), args.pop('expected')
+    binary = args['binary']
+    with open(file_name, 'wb') as f:
+        if binary:
+            f.write(loader.MAGIC)
+        GENERATORS[problem](f, np.random.default_rng(seed), **args)
+    if expected:
+        with open(expected, 'wb') as f:
+            subprocess.run([sys.executable, '-m', 'hack_the_interview',
+                            'solve', problem, os.path.abspath(file_name)],
+                           cwd=ROOT, stdout=f, check=True)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+# Hack the Interview II - April 2020
+# ---------------------------------- Purpose -----------------------------------
+# The solutions, one module per problem, with their checks in
+# hack_the_interview/checks. A solution can be imported on its own, e.g.
+#     from hack_the_interview.maximal_char_requests import getMaxCharCount_4
+# or, importing each solution only once it's used,
+#     import hack_the_interview
+#     hack_the_interview.product_distribution.maxScore([4, 1, 9, 7], 4)
+# ---------------------------------- Solution ----------------------------------
+# Importing a solution only defines its methods. The checks that used to run
+# at the bottom of each file are in hack_the_interview/checks, and everything
+# that runs from the command line goes through python -m hack_the_interview.
+# Heavy modules that only some methods need are imported when they're first
+# used: NumPy through lazyImport (which takes about 5ms to find NumPy instead
+# of 100ms to import it), and multiprocessing, tracemalloc, argparse and so on
+# inside the functions that use them. How long each solution takes to import
+# is checked against IMPORT_BUDGET by python -m hack_the_interview import-time.
+
+import importlib
+import importlib.util
+import sys
+from types import ModuleType
+from typing import Optional
+
+SOLUTIONS = ['product_distribution', 'maximal_char_requests',
+             'configuring_project_management', 'minimum_string_coefficient']
+# Most seconds importing a solution (in a fresh Python) should take
+IMPORT_BUDGET = 0.05
+
+def lazyImport(name: str) -> Optional[ModuleType]:
+    """
+    Returns module that's only imported when one of its attributes is first
+    used, or None if it isn't installed
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        return None
+    spec.loader = importlib.util.LazyLoader(spec.loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+def __getattr__(name: str) -> ModuleType:
+    # Import solutions the first time they're used as attributes
+    if name in SOLUTIONS:
+        return importlib.import_module('.' + name, __name__)
+    raise AttributeError("module {0!r} has no attribute {1!r}".format(
+                         __name__, name))
@@ -0,0 +1,128 @@
+# Command Line
+# Hack the Interview II - April 2020
+# ---------------------------------- Purpose -----------------------------------
+# One entry point for everything the solutions do from the command line:
+# solving a test case with a chosen method, running the checks, and making
+# sure importing the solutions stays fast, and serving them to other programs.
+# ---------------------------------- Solution ----------------------------------
+# solve hands the rest of the command line to the solution's main (and so to
+# loader.main), check runs each problem's checks as a script (failing if any
+# of them failed), and import-time imports each solution in a fresh Python (so
+# nothing is cached already) a few times, failing if the fastest import is over
+# the budget. serve runs the solver service (see service.py) until it's
+# interrupted.
+#
+# Usage:
+# python -m hack_the_interview solve PROBLEM INPUT [METHOD] [--report FILE]
+#                                    [--memory] [--cprofile FILE | --stacks FILE]
+# python -m hack_the_interview check [PROBLEM ...]
+# python -m hack_the_interview import-time [--budget SECONDS]
+# python -m hack_the_interview serve [--socket PATH | --port PORT]
+#                                    [--workers N] [--max-pending N]
+
+import argparse
+import asyncio
+import importlib
+import runpy
+import subprocess
+import sys
+from typing import List
+
+from hack_the_interview import IMPORT_BUDGET, SOLUTIONS
+
+# Command line names of the problems (as in test-cases), and their modules
+PROBLEMS = {name.replace('_', '-'): name for name in SOLUTIONS}
+# Everything with checks, and their modules in hack_the_interview.checks
+CHECKS = dict(PROBLEMS, service='service')
+# Prints how long importing the module named by argv[1] takes
+TIME_IMPORT = ("import sys, time; start = time.perf_counter(); "
+               "__import__(sys.argv[1]); print(time.perf_counter() - start)")
+
+def importTime(module: str, repeats: int = 3) -> float:
+    """
+    Returns fewest seconds importing module takes in a fresh Python
+    """
+    return min(float(subprocess.run([sys.executable, '-c', TIME_IMPORT, module],
+                                    capture_output=True, check=True,
+                                    text=True).stdout)
+               for _ in range(repeats))
+
+async def serveForever(path: str, port: int, workers: int,
+                       max_pending: int):
+    """
+    Runs the solver service until it's interrupted
+    """
+    from hack_the_interview.service import SolverService
+    service = SolverService(workers, max_pending)
+    try:
+        server = await service.serve(path, port=port)
+        address = path or 'port {0}'.format(
+                  server.sockets[0].getsockname()[1])
+        print("Serving on " + address, file=sys.stderr, flush=True)
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m hack_the_interview')
+    commands = parser.add_subparsers(dest='command', required=True)
+    solve = commands.add_parser('solve', help="solve a test case",
+                                add_help=False)
+    solve.add_argument('problem', choices=PROBLEMS)
+    check = commands.add_parser('check', help="run the checks")
+    check.add_argument('problems', nargs='*', metavar='problem',
+                       help="one of " + ", ".join(CHECKS) + " (all of "
+                       "them if none are given)")
+    import_time = commands.add_parser('import-time', help="time importing "
+                                      "each solution")
+    import_time.add_argument('--budget', type=float, default=IMPORT_BUDGET)
+    serve = commands.add_parser('serve', help="run the solver service")
+    addresses = serve.add_mutually_exclusive_group()
+    addresses.add_argument('--socket', help="Unix socket to listen on")
+    addresses.add_argument('--port', type=int, default=0,
+                           help="TCP port to listen on, on localhost")
+    serve.add_argument('--workers', type=int,
+                       help="worker processes (one per CPU by default)")
+    serve.add_argument('--max-pending', type=int, default=64,
+                       help="most batches waiting or being solved at once")
+    # Everything after the problem is the solution's to parse
+    args, rest = parser.parse_known_args(argv)
+
+    if args.command == 'solve':
+        module = importlib.import_module('hack_the_interview.' +
+                                         PROBLEMS[args.problem])
+        module.main(rest)
+    elif rest:
+        parser.error("unrecognized arguments: " + ' '.join(rest))
+    elif args.command == 'check':
+        for problem in args.problems:
+            if problem not in CHECKS:
+                parser.error("unknown problem " + problem)
+        from hack_the_interview import checks
+        for problem in args.problems or CHECKS:
+            print(problem)
+            runpy.run_module('hack_the_interview.checks.' + CHECKS[problem],
+                             run_name='__main__')
+        if checks.failures:
+            print("{0} checks failed".format(checks.failures))
+            return 1
+    elif args.command == 'serve':
+        try:
+            asyncio.run(serveForever(args.socket, args.port, args.workers,
+                                     args.max_pending))
+        except KeyboardInterrupt:
+            pass
+    else:
+        over = False
+        for name in SOLUTIONS:
+            seconds = importTime('hack_the_interview.' + name)
+            over = over or seconds > args.budget
+            print("{0:32} {1:.4f}s".format(name, seconds))
+        if over:
+            print("Importing is over the budget of {0}s".format(args.budget))
+            return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,82 @@
+# Checks
+# Hack the Interview II - April 2020
+# ---------------------------------- Purpose -----------------------------------
+# The driver code of each solution: checks of every method against examples,
+# HackerRank's test cases and each other. Each module here is a script that
+# runs its checks when it's imported, so run them with
+#     python -m hack_the_interview check [PROBLEM ...]
+# rather than importing them.
+# ---------------------------------- Solution ----------------------------------
+# The scripts print Passed or what failed through check() and fail(), which
+# count the failures so that the command line can exit with an error if there
+# were any. HackerRank's test cases are found by listCases() and read through
+# loader's parse functions by readCases(), for the scripts and benchmark.py.
+
+import os
+from typing import Iterator, List, Tuple
+
+from hack_the_interview import loader
+
+# HackerRank's test cases, at the top of the repository
+TEST_CASES = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(
+                          os.path.abspath(__file__)))), 'test-cases')
+
+# How many checks have failed, in every script run so far
+failures = 0
+
+def fail(failure: str):
+    """
+    Prints what failed, counting it
+    """
+    global failures
+    failures += 1
+    print(failure)
+
+def check(passed: bool, failure: str) -> bool:
+    """
+    Prints Passed, or what failed (counting it)
+    """
+    if passed:
+        print("Passed")
+    else:
+        fail(failure)
+    return passed
+
+def listCases(problem: str) -> List[str]:
+    """
+    Returns names of the inputs of a problem's test cases that have an output
+    """
+    path = os.path.join(TEST_CASES, problem)
+    if not(os.path.isdir(path)):
+        return []
+    return [name for name in sorted(os.listdir(path))
+            if name.startswith('input') and
+            os.path.exists(os.path.join(path, name.replace('input', 'output')))]
+
+def parseCase(problem: str, buf: bytes):
+    """
+    Parses a test case with loader, into the Python lists the methods take
+    """
+    if problem == 'product-distribution':
+        a, m = loader.parseProductDistribution(buf)
+        return loader.asList(a), m
+    if problem == 'maximal-char-requests':
+        s, queries = loader.parseMaximalChar(buf)
+        return s, loader.asList(queries)
+    if problem == 'configuring-project-management':
+        return [(n, loader.asList(friendships))
+                for n, friendships in loader.parseProjectManagement(buf)]
+    return loader.parseStringCoeff(buf)
+
+def readCases(problem: str) -> Iterator[Tuple[str, object, List[List[int]]]]:
+    """
+    Yields name, parsed input and expected output lines of each of a problem's
+    test cases
+    """
+    path = os.path.join(TEST_CASES, problem)
+    for name in listCases(problem):
+        case = parseCase(problem, loader.readInput(os.path.join(path, name)))
+        with open(os.path.join(path, name.replace('input', 'output'))) as f:
+            expected = [[int(x) for x in line.split()] for line in f
+                        if line.split()]
+        yield name, case, expected
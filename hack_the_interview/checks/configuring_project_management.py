@@ -0,0 +1,130 @@
+# Configuring Project Management - Checks
+# Hack the Interview II - April 2020
+# Checks the methods of hack_the_interview/configuring_project_management.py
+# against examples, HackerRank's test cases and each other. This is a script
+# that runs the checks when it's imported, so run it with
+# python -m hack_the_interview check configuring-project-management
+
+import os
+from random import randint
+
+from hack_the_interview.checks import TEST_CASES, check, fail, readCases
+from hack_the_interview.configuring_project_management import *
+
+cases = [   (10 ** 6, []),
+            (2, [[1, 2]]),
+            (3, [[3, 2], [1, 2]]),
+            (2, [[1, 3],[4, 6], [1, 5]]),
+            (4, [[1, 2], [1, 3], [1, 4], [2, 3], [2, 4], [3, 4]]),
+            (6, [[1, 5], [1, 2], [1, 3], [1, 4], [2, 4], [2, 6], [3, 6]]),
+            (9, [[1, 3],[1, 4], [3, 2], [5, 6], [7, 1], [2, 8], [8, 9], [9, 1]])
+]
+
+# Generate a random case with 10 students and 15 friendships
+n = 10
+friendships = []
+for i in range(15):
+    a, b = randint(1, n), randint(1, n)
+    friendships.append([a, b])
+cases.append((n, friendships))
+
+for case in cases:
+    n, friendships = case
+    res = configureProjectPresentation(n, friendships)
+    print(res)
+    # Check Methods 3 and 4, and whichever method is picked for the density,
+    # against Method 2
+    for method in (configureProjectPresentation_3, 
+                   configureProjectPresentation_4,
+                   configureProjectPresentationAuto):
+        method_res = method(n, friendships)
+        if not(method_res == res):
+            fail("{0} failed with {1} expected {2}".format(case, method_res, 
+                                                          res))
+
+# Check Method 3 against HackerRank's test cases (one line of invitees per case)
+for name, test_cases, expected in readCases('configuring-project-management'):
+    # And Method 4, and whichever method is picked for the density
+    for method in (configureProjectPresentation_3, 
+                   configureProjectPresentation_4,
+                   configureProjectPresentationAuto):
+        res = [method(n, friendships) for n, friendships in test_cases]
+        check(res == expected, "{0} failed with {1}".format(
+              name, method.__name__))
+    # And Method 6 straight from the file, with tiny chunks on small files so
+    # that numbers and friendships get split between chunks
+    input_name = os.path.join(TEST_CASES, 'configuring-project-management', 
+                              name)
+    chunk_size = 7 if os.path.getsize(input_name) < 2 ** 12 else 2 ** 20
+    res = list(configureProjectPresentationStream(input_name, chunk_size))
+    check(res == expected, 
+          "{0} failed with configureProjectPresentationStream".format(name))
+
+# Check Method 4 on random pairs and distances against a breadth first search
+n = 30
+friendships = [[randint(1, n), randint(1, n)] for _ in range(60)]
+graph = FriendshipGraph(n, friendships)
+queries = [(randint(1, n), randint(1, n), randint(0, 3)) for _ in range(100)]
+failed = False
+for query, res in zip(queries, graph.queryBatch(queries)):
+    a, b, hops = query
+    # Everyone within hops of b, without stepping onto a
+    within, frontier = {a, b}, {b}
+    for _ in range(hops):
+        frontier = {y for x, y in friendships if x in frontier} | \
+                   {x for x, y in friendships if y in frontier}
+        frontier -= within
+        within |= frontier
+    expected = sorted(({y for x, y in friendships if x == a} | 
+                       {x for x, y in friendships if y == a}) - within)
+    if not(res == expected):
+        fail("{0} failed with {1} expected {2}".format(query, res, expected))
+        failed = True
+if not(failed):
+    print("Passed")
+
+# A bad query is rejected without leaving students marked in the graph
+graph = FriendshipGraph(5, [[1, 3], [3, 5], [1, 4], [1, 5]])
+before = graph.query(1, 2, 2)
+try:
+    graph.query(1, -1, 1)
+    fail("Query of student -1 didn't fail")
+except ValueError:
+    check(graph.query(1, 2, 2) == before == [3, 4, 5], 
+          "Bad query changed later answers")
+
+# Check Method 5 against Method 2 on random graphs from sparse to dense
+for density in (0.01, 0.1, 0.5, 1):
+    n = randint(3, 200)
+    friendships = [[randint(0, n + 1), randint(0, n + 1)] 
+                   for _ in range(int(density * n * n))]
+    res = configureProjectPresentation_5(n, friendships)
+    expected = configureProjectPresentation(n, friendships)
+    check(res == expected, "{0} failed with {1} expected {2}".format(
+          (n, density), res, expected))
+
+# Randomly add and remove friendships, checking Method 7 against Method 2 after
+# every change
+for _ in range(20):
+    n = randint(2, 12)
+    friendships = []
+    invite_list = InviteList(n)
+    failed = False
+    for _ in range(100):
+        # Remove a random friendship a third of the time (if there are any)
+        if friendships and not(randint(0, 2)):
+            a, b = friendships.pop(randint(0, len(friendships) - 1))
+            invite_list.remove(a, b)
+        else:
+            a, b = randint(0, n + 1), randint(0, n + 1)
+            friendships.append([a, b])
+            invite_list.add(a, b)
+        res = invite_list.invites()
+        expected = configureProjectPresentation(n, friendships)
+        if not(res == expected):
+            fail("{0} failed with {1} expected {2}".format((n, friendships), 
+                                                          res, expected))
+            failed = True
+            break
+    if not(failed):
+        print("Passed")
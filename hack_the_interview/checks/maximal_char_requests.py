@@ -0,0 +1,159 @@
+# Maximal Char Requests - Checks
+# Hack the Interview II - April 2020
+# Checks the methods of hack_the_interview/maximal_char_requests.py against
+# examples, HackerRank's test cases and each other. This is a script that
+# runs the checks when it's imported, so run it with
+# python -m hack_the_interview check maximal-char-requests
+
+import os
+from random import randint
+from tempfile import TemporaryDirectory
+
+from hack_the_interview import loader
+from hack_the_interview.checks import check, fail, readCases
+from hack_the_interview.maximal_char_requests import *
+
+# Guarded so that worker processes can import this file without running it
+if __name__ == '__main__':
+    cases = [   ('aAabBcba', [[2, 6], [1, 2], [2, 2], [0, 4], [0, 7]]),
+                ('ddaaa', [[0, 4]]),
+                ('ddddddd', [[1, 2], [0, 6]]),
+                ('AbaBacD', [[0, 4]]),
+                ('AbaBacD', [[0, 7], [1, 7], [2, 7], [3, 7], [4, 7], [5, 7], [6, 7], [7, 7]]),
+                ('AbaBacD', [[0, 0], [0, 1], [0, 2], [0, 3], [0, 4], [0, 5], [0, 6], [0, 7]]),
+                ('AbaBacD', [[7, 7], [6, 7], [5, 7], [4, 7], [3, 7], [2, 7], [1, 7], [0, 7]]),
+                ('', [[100000, 0], [0, 9]]),
+                ('abcdefhijklMnopQrstVvwxYz', [[0, 100], [-100, 5], [5, 6], [0, 10], [10, 20], [20, 50], [50, 75], [1, 1], [100, 100], [-5, -5],  [10, 20]]),
+                ('fazcdefz', [[0, 7]]),
+                ('abcdefhijklMnopQrstVvwxYz', [[-100, 5]])
+    ]
+    for case in cases:
+        s, queries = case
+        res = getMaxCharCount(s, queries)
+        print(res)
+        # Check Method 4 against Method 3
+        res_4 = getMaxCharCount_4(s, queries)
+        if not(res_4 == res):
+            fail("{0} failed with {1} expected {2}".format(case, res_4, res))
+
+    # Check Method 4 against HackerRank's test cases (one answer per line)
+    test_cases = [(name, s, queries, [line[0] for line in expected])
+                  for name, (s, queries), expected in
+                  readCases('maximal-char-requests')]
+    for name, s, queries, expected in test_cases:
+        # And Method 8
+        for method in (getMaxCharCount_4, getMaxCharCount_8):
+            res = method(s, queries)
+            check(res == expected, "{0} failed with {1}".format(
+                  name, method.__name__))
+
+    # Check Method 8 on other alphabets (Unicode, bytes and integers) against 
+    # scanning each interval
+    for symbols in ('\u00e9a\u4e2d\u00e9\U0001f600z\u4e2d\U0001f600\U0001f600', 
+                    bytes([randint(0, 255) for _ in range(300)]),
+                    [randint(-1000, 1000) for _ in range(300)]):
+        wavelet_matrix = WaveletMatrix(symbols)
+        for _ in range(100):
+            i, j = randint(-5, len(symbols) + 5), randint(-5, len(symbols) + 5)
+            interval = symbols[max(0, i):max(0, j + 1)]
+            expected = (max(interval), interval.count(max(interval))) \
+                       if interval else (None, 0)
+            res = wavelet_matrix.query(i, j)
+            if not(res == expected):
+                fail("{0} failed with {1} expected {2}".format(
+                     (type(symbols).__name__, i, j), res, expected))
+                break
+        else:
+            print("Passed")
+
+    # Randomly edit strings, checking Method 5 against Method 3 after every edit
+    # Random mix of upper and lower case a - f
+    def random_char() -> str:
+        return chr(randint(65, 70) + 32 * randint(0, 1))
+
+    for _ in range(20):
+        chars = [random_char() for _ in range(randint(1, 30))]
+        tree = MaxCharTree(''.join(chars))
+        failed = False
+        for _ in range(50):
+            i, c = randint(0, len(chars) - 1), random_char()
+            chars[i] = c
+            tree.set(i, c)
+            queries = [[randint(-5, 35), randint(-5, 35)] for _ in range(5)]
+            res = [tree.query(*query) for query in queries]
+            expected = getMaxCharCount(''.join(chars), queries)
+            if not(res == expected):
+                fail("{0} failed with {1} expected {2}".format(
+                     (chars, queries), res, expected))
+                failed = True
+                break
+        if not(failed):
+            print("Passed")
+
+    # Chars that lowercase to more than one char lengthen the string like in
+    # Method 3
+    queries = [[1, 5], [2, 2], [1, 1]]
+    res = getMaxCharCount_5('\u0130abc', queries)
+    expected = getMaxCharCount('\u0130abc', queries)
+    check(res == expected, "{0} failed with {1} expected {2}".format(
+          queries, res, expected))
+    # But they can't replace a single char, and neither can several chars
+    tree = MaxCharTree('abc')
+    for c in ('\u0130', 'ab', ''):
+        try:
+            tree.set(0, c)
+            fail("Setting {0!r} didn't fail".format(c))
+        except ValueError:
+            check(tree.query(0, 2) == 1, 
+                  "Setting {0!r} changed the tree".format(c))
+
+    # Compare Method 5 with rebuilding Method 3 after every edit on large cases
+    large_cases = [case for case in test_cases if case[0] in 
+                   ('input07.txt', 'input08.txt', 'input09.txt', 'input10.txt')]
+    for name, s, queries, _ in large_cases:
+        build_time, tree_time, rebuild_time = benchmarkEdits(s, queries, 50)
+        print("{0}: Method 5 takes {1:.3f}s to build then {2:.6f}s per edit, "
+              "rebuilding Method 3 takes {3:.6f}s per edit".format(
+              name, build_time, tree_time, rebuild_time))
+
+    # Check Method 6 against the large cases and measure how it scales
+    for name, s, queries, expected in large_cases:
+        res = getMaxCharCount_6(s, queries)
+        check(res == expected, "{0} failed".format(name))
+        times = benchmarkWorkers(s, queries, max(2, os.cpu_count() or 1))
+        print("{0}: ".format(name) + ", ".join(
+            "{0} workers {1:.3f}s".format(i + 1, t) for i, t in enumerate(times)))
+
+    # Query the same strings repeatedly through Method 7's cache, first with a 
+    # cache that's too small to hold all of them and then from a new cache that
+    # only has the tables saved on disk
+    with TemporaryDirectory() as spill_dir:
+        for max_bytes in (10 ** 3, 10 ** 6):
+            cache = CharIndexCache(max_bytes, spill_dir, 10 ** 6)
+            for _ in range(3):
+                for case in cases:
+                    s, queries = case
+                    res = getMaxCharCount_7(s, queries, cache)
+                    if not(res == getMaxCharCount(s, queries)):
+                        fail("{0} failed with {1}".format(case, res))
+            print("Cache of {0} bytes: {1} hits, {2} disk hits, {3} misses, "
+                  "{4} evictions".format(max_bytes, cache.hits, cache.disk_hits,
+                                         cache.misses, cache.evictions))
+        # Then with a directory too small to hold all of them, which has to
+        # stay under its limit
+        cache = CharIndexCache(10 ** 3, spill_dir, 10 ** 3)
+        for case in cases:
+            s, queries = case
+            res = getMaxCharCount_7(s, queries, cache)
+            if not(res == getMaxCharCount(s, queries)):
+                fail("{0} failed with {1}".format(case, res))
+        spill_bytes = sum(os.path.getsize(os.path.join(spill_dir, name))
+                          for name in os.listdir(spill_dir))
+        check(spill_bytes <= 10 ** 3, "Spill directory grew to {0} bytes "
+              "with {1} deleted".format(spill_bytes, cache.disk_evictions))
+
+    # An empty string is still its own line, so the number of queries isn't
+    # read as the string
+    s, queries = loader.parseMaximalChar(b'0\n\n2\n0 1\n1 2\n')
+    check(s == '' and loader.asList(queries) == [[0, 1], [1, 2]],
+          "Parsing an empty string failed with {0!r}".format(s))
@@ -0,0 +1,154 @@
+# Minimum String Co-Efficient - Checks
+# Hack the Interview II - April 2020
+# Checks the methods of hack_the_interview/minimum_string_coefficient.py against
+# examples, HackerRank's test cases and each other. This is a script that
+# runs the checks when it's imported, so run it with
+# python -m hack_the_interview check minimum-string-coefficient
+
+from itertools import product
+from random import randint
+
+from hack_the_interview.checks import check, fail, readCases
+from hack_the_interview.minimum_string_coefficient import *
+
+cases = [   ('110100100', 1, 2),
+            ('110100100', 2, 0),
+            ('1101011111000001110001110001', 0, 25),
+            ('1101011111000001110001110001', 1, 19),
+            ('1101011111000001110001110001', 2, 13),
+            ('1101011111000001110001110001', 3, 3),
+            ('1101011111000001110001110001', 4, 1),
+            ('1101011111000001110001110001', 5, 0),
+            ('1101011111000001110001110001', 6, 0),
+            ('1101011111000001110001110001', 7, 0),
+            ('1101011111000001110001110001', 8, 0),
+            ('11011001001', 2, 1),
+            ('1101', 1, 0),
+            ('1011010', 1, 2),
+            ('1011010', 2, 0),
+            ('010', 1, 0),
+            ('010', 0, 1),
+            ('', 1, 0),
+            ('1', 1, 0),
+            ('101010101', 3, 1),
+            ('11', 100, 0),
+            ('101010', 1, 2),
+            ('10101', 1, 1),
+            ('000000000000000000', 0, 0),
+            ('10101010101010101', 0, 15),
+            ('101010', 5, 0),
+            ('110100100', 0, 5),
+            ('10110110011001111101110100000110', 0, 30),
+            ('10110110011001111101110100000110', 1, 23),
+            ('10110110011001111101110100000110', 2, 20),
+            ('10110110011001111101110100000110', 3, 17),
+            ('10110110011001111101110100000110', 4, 10),
+            ('10110110011001111101110100000110', 5, 6),
+            ('10110110011001111101110100000110', 6, 2),
+            ('10110110011001111101110100000110', 7, 0),
+            ('101111100000010101', 2, 3),
+            ('10110110011001111101110100000110', 4, 10),
+            ('1100101110101100', 1, None)
+]
+
+for case in cases:
+    s, p, expected = case
+    res = minStringCoeff(s, p)
+    # Use brute force when there's no expected answer
+    if expected is None:
+        expected = minStringCoeffsBruteForce(s, p)
+    check(res == expected, "{0} failed with {1} expected {2}".format(
+          (s, p), res, expected))
+
+# Check against HackerRank's test cases (none were made available, but 
+# generate.py can make some)
+for name, (s, p), expected in readCases('minimum-string-coefficient'):
+    res = minStringCoeff(s, p)
+    check(res == expected[0][0], "{0} failed with {1}".format(name, res))
+
+# Check the whole curve against brute force on every string of up to 8 bits
+max_p, failed = 2, False
+for bit_len in range(9):
+    for bits in product('01', repeat=bit_len):
+        s = ''.join(bits)
+        res = minStringCoeffs(s, max_p)
+        expected = [minStringCoeffsBruteForce(s, p) for p in range(max_p + 1)]
+        if not(res == expected):
+            fail("{0} failed with {1} expected {2}".format(s, res, expected))
+            failed = True
+if not(failed):
+    print("Passed")
+
+# Check packed bits (and arrays of bits) against strings, with random lengths 
+# so that the last byte is padded
+failed = False
+for _ in range(200):
+    s = ''.join(str(randint(0, 1)) for _ in range(randint(0, 100)))
+    padding = -len(s) % 8
+    packed = int(s + '0' * padding, 2).to_bytes((len(s) + padding) // 8, 'big') \
+             if s else b''
+    expected = minStringCoeffs(s, 10)
+    for bits in (packed, bytearray(packed), 
+                 np.array([int(c) for c in s], dtype=np.uint8)):
+        res = minStringCoeffsBits(bits, 10, len(s))
+        if not(res == expected):
+            fail("{0} failed with {1} expected {2}".format(s, res, expected))
+            failed = True
+if not(failed):
+    print("Passed")
+
+# Check the oracle against brute force on every string of up to 8 bits, and the
+# shortcut distances against the breadth first search
+failed = False
+for bit_len in range(1, 11):
+    if not((flipDistances(np.arange(2 ** bit_len, dtype=np.uint64)) == 
+            flipDistancesBFS(bit_len)).all()):
+        fail("Distances for {0} bits failed".format(bit_len))
+        failed = True
+for bit_len in range(9):
+    for bits in product('01', repeat=bit_len):
+        s = ''.join(bits)
+        res = minStringCoeffsOracle(s, 2)
+        expected = [minStringCoeffsBruteForce(s, p) for p in range(3)]
+        if not(res == expected):
+            fail("{0} failed with {1} expected {2}".format(s, res, expected))
+            failed = True
+if not(failed):
+    print("Passed")
+
+# Check the Boundary Method against the oracle on random strings of up to 24
+# bits for every p
+res = differentialTest(minStringCoeffs, minStringCoeffsOracle, 5, 24, 12)
+check(res is None, "Shrunk to {0} failing".format(res))
+
+# Feed random strings in random pieces (as str and as bytes), checking both 
+# kinds of streaming against the whole string
+failed = False
+for _ in range(100):
+    s = ''.join(str(randint(0, 1)) * randint(1, 4) 
+                for _ in range(randint(0, 30)))
+    cuts = sorted(randint(0, len(s)) for _ in range(randint(0, 5)))
+    pieces = [s[i:j] for i, j in zip([0] + cuts, cuts + [len(s)])]
+    p = randint(0, 6)
+    expected = minStringCoeffs(s, p)
+    for stream in (StreamingCoeff(), StreamingCoeff(p)):
+        for piece in pieces:
+            stream.feed(piece.encode() if randint(0, 1) else piece)
+        res = [stream.minStringCoeff(i) for i in range(p + 1)]
+        if not(res == expected):
+            fail("{0} failed with {1} expected {2}".format((pieces, p), res, 
+                                                          expected))
+            failed = True
+if not(failed):
+    print("Passed")
+
+# Anything but 0s and 1s is rejected without changing what was fed before it
+stream = StreamingCoeff()
+stream.feed('0110')
+for piece in ('01x', b'0 1', '\n'):
+    try:
+        stream.feed(piece)
+        fail("Feeding {0!r} didn't fail".format(piece))
+    except ValueError:
+        check(stream.minStringCoeff(0) == minStringCoeff('0110', 0),
+              "Feeding {0!r} changed the stream".format(piece))
@@ -0,0 +1,69 @@
+# Product Distribution - Checks
+# Hack the Interview II - April 2020
+# Checks the methods of hack_the_interview/product_distribution.py against
+# examples, HackerRank's test cases and each other. This is a script that
+# runs the checks when it's imported, so run it with
+# python -m hack_the_interview check product-distribution
+
+from itertools import accumulate
+from random import randint
+
+from hack_the_interview.checks import check, fail, readCases
+from hack_the_interview.product_distribution import *
+
+cases = [   ([4, 1, 9, 7],                          4, 21),
+            ([1, 5, 4, 2, 3],                       2, 27),
+            ([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11],   3, 171),
+            ([],                                    5, 0),
+            ([1, 2, 3, 4],                          1, 30)
+]
+
+# Add HackerRank's test cases
+for name, (a, m), expected in readCases('product-distribution'):
+    cases.append((a, m, expected[0][0]))
+
+for case in cases:
+    a, m, expected = case
+    # Check that both methods agree with the expected score
+    for method in (maxScore, maxScoreVectorized):
+        res = method(a, m)
+        check(res == expected, "{0} failed with {1} expected {2}".format(
+              (a, m), res, expected))
+    # Check the sweep against the regular method for every threshold
+    curve = SortedProducts(a).sweep()
+    expected = [maxScore(a, m) for m in range(1, len(a) + 1)]
+    check(curve == expected, "{0} sweep failed with {1} expected {2}".format(
+          a, curve, expected))
+
+# Score every case in one batch and check it against the regular method
+values = [x for a, _, _ in cases for x in a]
+offsets = list(accumulate((len(a) for a, _, _ in cases), initial=0))
+ms = [m for _, m, _ in cases]
+res = maxScoreBatch(values, offsets, ms)
+expected = [maxScore(a, m) for a, m, _ in cases]
+check(res == expected, "Batch failed with {0} expected {1}".format(
+      res, expected))
+
+# Randomly insert and delete integers, checking the dynamic score against the
+# regular method after every operation
+for m in range(1, 6):
+    a = [randint(-10, 100) for _ in range(randint(0, 10))]
+    dynamic = DynamicProducts(a, m)
+    failed = False
+    for _ in range(200):
+        # Delete a random integer half the time (if there are any)
+        if a and randint(0, 1):
+            x = a.pop(randint(0, len(a) - 1))
+            dynamic.delete(x)
+        else:
+            x = randint(-10, 100)
+            a.append(x)
+            dynamic.insert(x)
+        res, expected = dynamic.maxScore(), maxScore(a, m)
+        if not(res == expected):
+            fail("{0} dynamic failed with {1} expected {2}".format((a, m), res,
+                                                                  expected))
+            failed = True
+            break
+    if not(failed):
+        print("Passed")
@@ -0,0 +1,193 @@
+# Solver Service - Checks
+# Hack the Interview II - April 2020
+# Checks hack_the_interview/service.py against HackerRank's test cases and the
+# solutions' own methods, in process and over sockets. This is a script that
+# runs the checks when it's imported, so run it with
+# python -m hack_the_interview check service
+
+import asyncio
+import json
+import os
+import signal
+from random import randint
+from tempfile import TemporaryDirectory
+from typing import List
+
+from hack_the_interview import service
+from hack_the_interview.checks import check, fail, readCases
+from hack_the_interview.configuring_project_management import \
+    configureProjectPresentation
+from hack_the_interview.maximal_char_requests import getMaxCharCount
+from hack_the_interview.minimum_string_coefficient import \
+    minStringCoeffsBruteForce
+from hack_the_interview.product_distribution import maxScore
+from hack_the_interview.service import Client, LocalClient, SolverService
+
+def toRequest(problem: str, case) -> List[list]:
+    """
+    Returns the cases of a request for one of HackerRank's test cases
+    """
+    if problem == 'configuring-project-management':
+        return [list(graph) for graph in case]
+    return [list(case)]
+
+def toLines(problem: str, results: list) -> List[List[int]]:
+    """
+    Returns results as they'd be written to the output file
+    """
+    if problem == 'product-distribution':
+        return [[results[0]]]
+    if problem == 'maximal-char-requests':
+        return [[count] for count in results[0]]
+    return results
+
+def randomCases(problem: str, count: int):
+    """
+    Returns small random cases of a problem, some of them repeated so that
+    their indices are reused
+    """
+    cases = []
+    for _ in range(count):
+        if problem == 'product-distribution':
+            case = [[randint(1, 100) for _ in range(randint(1, 20))],
+                    randint(1, 5)]
+        elif problem == 'maximal-char-requests':
+            s = ''.join(chr(randint(97, 102) - 32 * randint(0, 1))
+                        for _ in range(randint(1, 30)))
+            queries = [sorted([randint(0, len(s) - 1), randint(0, len(s) - 1)])
+                       for _ in range(5)]
+            case = [s, queries]
+        elif problem == 'configuring-project-management':
+            n = randint(2, 10)
+            case = [n, [[randint(1, n), randint(1, n)] for _ in range(12)]]
+        else:
+            s = ''.join(str(randint(0, 1)) for _ in range(randint(1, 10)))
+            case = [s, randint(0, 3)]
+        cases.append(case)
+        if randint(0, 2) == 0:
+            cases.append(case)
+    return cases
+
+def expect(problem: str, case: list):
+    """
+    Answers a case with the solution's own method
+    """
+    if problem == 'product-distribution':
+        return maxScore(*case)
+    if problem == 'maximal-char-requests':
+        return getMaxCharCount(*case)
+    if problem == 'configuring-project-management':
+        return configureProjectPresentation(*case)
+    return minStringCoeffsBruteForce(*case)
+
+async def checkService(client: LocalClient, problems: list):
+    """
+    Checks a client's answers against HackerRank's test cases and the
+    solutions' own methods
+    """
+    for problem in problems:
+        for name, case, expected in readCases(problem):
+            res = toLines(problem, await client.solve(
+                          problem, toRequest(problem, case)))
+            check(res == expected, "{0} {1} failed".format(problem, name))
+        cases = randomCases(problem, 30)
+        res = await client.solve(problem, cases)
+        expected = [expect(problem, case) for case in cases]
+        check(res == expected, "{0} failed with {1} expected {2}".format(
+              problem, res, expected))
+
+async def checkLocal():
+    # Solved in a thread of this process, so its indices can be looked at
+    local = SolverService(workers=0, max_pending=2)
+    client = LocalClient(local)
+    await checkService(client, list(service.MODULES))
+    # The same string again reuses its index instead of building another
+    service.indices.clear()
+    s = 'aAabBcba' * 50
+    for _ in range(3):
+        await client.solve('minimum-string-coefficient', [[s[:40], 2]])
+        res = await client.solve('maximal-char-requests', [[s, [[0, 9]]]])
+    check(len(service.indices['minimum-string-coefficient']) == 1 and
+          res == [getMaxCharCount(s, [[0, 9]])], "Warm index failed")
+    # A method can be named instead of using the warm index
+    res = await client.solve('maximal-char-requests', [['aAabBcba', [[2, 6]]]],
+                             'getMaxCharCount_8')
+    check(res == [[1]], "Method failed with {0}".format(res))
+    # Integers too large for int64 still get a warm index
+    case = [[2 ** 70, 3, -2 ** 65, 5], 2]
+    res = await client.solve('product-distribution', [case])
+    check(res == [expect('product-distribution', case)],
+          "Large integers failed with {0}".format(res))
+
+    # Backpressure: no more than max_pending batches are ever solved at once
+    solve, most = local.solve, [0]
+    async def countingSolve(*args):
+        most[0] = max(most[0], local.in_flight)
+        return await solve(*args)
+    local.solve = countingSolve
+    cases = randomCases('product-distribution', 40)
+    res = await asyncio.gather(*(client.solve('product-distribution', [case])
+                                 for case in cases))
+    check(most[0] <= 2 and
+          res == [[expect('product-distribution', case)] for case in cases],
+          "Backpressure failed with {0} in flight".format(most[0]))
+
+    # Bad requests get an error instead of results
+    for problem, method in (('no-such-problem', None),
+                            ('product-distribution', 'noSuchMethod')):
+        try:
+            await client.solve(problem, [], method)
+            fail("{0} {1} didn't fail".format(problem, method))
+        except RuntimeError:
+            print("Passed")
+    metrics = await client.metrics()
+    counts = metrics['problems']['product-distribution']
+    check(counts['errors'] == 1 and 0 < counts['p50'] <= counts['p99'],
+          "Metrics failed with {0}".format(metrics))
+    local.close()
+
+async def checkSockets(path: str):
+    remote = SolverService(workers=2)
+    unix_server = await remote.serve(path)
+    tcp_server = await remote.serve(port=0)
+    port = tcp_server.sockets[0].getsockname()[1]
+    try:
+        # Pipelined requests over both sockets, answered by two workers
+        for client in (await Client.connect(path),
+                       await Client.connect(port=port)):
+            batches = [(problem, randomCases(problem, 10))
+                       for problem in list(service.MODULES) * 3]
+            res = await asyncio.gather(*(client.solve(problem, cases)
+                                         for problem, cases in batches))
+            check(res == [[expect(problem, case) for case in cases]
+                          for problem, cases in batches],
+                  "Pipelining failed with {0}".format(res))
+            await checkService(client, ['product-distribution',
+                                        'configuring-project-management'])
+            await client.close()
+        # Lines that aren't requests get an error, and the connection stays up
+        reader, writer = await asyncio.open_unix_connection(path)
+        writer.write(b'not json\n\n{"id": 7, "metrics": true}\n')
+        await writer.drain()
+        responses = [json.loads(await reader.readline()) for _ in range(2)]
+        writer.close()
+        check('error' in responses[0] and responses[1]['id'] == 7,
+              "Bad line failed with {0}".format(responses))
+
+        # Workers that die are replaced, and their batches still answered
+        for executor in remote.executors:
+            os.kill(executor.submit(os.getpid).result(), signal.SIGKILL)
+        client = LocalClient(remote)
+        cases = randomCases('product-distribution', 20)
+        res = await client.solve('product-distribution', cases)
+        check(remote.restarts == 2 and
+              res == [expect('product-distribution', case) for case in cases],
+              "Restart failed with {0} restarts".format(remote.restarts))
+    finally:
+        unix_server.close()
+        tcp_server.close()
+        remote.close()
+
+asyncio.run(checkLocal())
+with TemporaryDirectory() as directory:
+    asyncio.run(checkSockets(os.path.join(directory, 'service.sock')))
@@ -0,0 +1,616 @@
+# Configuring Project Management
+# Hack the Interview II - April 2020
+# ----------------------------------- Prompt ------------------------------------
+# Given an array of relationships between 1 -> n students, determine which 
+# integers are friends with student 1 and are not friends with student 2 or any
+# of student 2's friends.
+# ---------------------------------- Solution ----------------------------------
+# Method 1: 
+# * This solution times out for large cases due to the n x n matrix *
+# Create an adjacency matrix to represent the graph. Then, get an array of all
+# of two's friends. For each of two's friends x, if they have an edge with
+# student 1, remove that edge. Then for all of x's friends, check if they have
+# an edge with student 1. If so, remove it. Then, return the array of all of 1's
+# friends.
+# Time: O(vertices + edges) | Space: O(vertices * vertices)
+#
+# Method 2:
+# Create a set of all of two's friends by iterating through the array of 
+# friendships and checking for a 2. Then create a set of all of two's friends'
+# friends by iterating through the friendship array again and checking for 
+# any friend in the two's friends set. Finally, iterate once more through the
+# array, checking for all friendships between 1 and anyone not in the two sets.
+# Time: O(edges) | Space: O(vertices)
+#
+# Method 3:
+# Method 2 as a handful of NumPy operations instead of three passes through a
+# list of lists. Load the friendships into one contiguous (edges x 2) int32 
+# array and drop the invalid ones with a single mask. Then two's friends, two's
+# friends' friends and one's friends are each a boolean mask over the student 
+# ids, filled in by indexing with the matching ends of the edges. The invitees 
+# are one's friends without the other two masks, and since the mask is indexed 
+# by student id, reading off its non-zero positions gives them already sorted.
+# Time: O(vertices + edges) | Space: O(vertices + edges)
+#
+# Method 4:
+# For asking the same question about many pairs of students on one graph, which
+# would otherwise rescan every friendship each time. Build a compressed sparse 
+# row (CSR) index once: every friendship in both directions sorted by student, 
+# so that student x's friends are neighbours[offsets[x]:offsets[x + 1]]. A 
+# query (a, b, hops) returns a's friends that aren't within hops friendships of
+# b, without going through a (so one and two are query (1, 2, 2)). It searches
+# outwards from b one frontier at a time, gathering all of the frontier's 
+# friends in one go and marking them in a bitset of seen students, which is
+# cleared afterwards by resetting only the students that were marked.
+# Time: O(vertices + edges) to build, O(degrees within hops of b + degree of a)
+# per query | Space: O(vertices + edges)
+#
+# Method 5:
+# Method 1 with an adjacency matrix that's small enough to use. Each student's
+# row is packed into 64 bit words, one bit per student, so the whole matrix is 
+# vertices^2 / 8 bytes instead of a list of lists of Python ints. Removing two's
+# friends and their friends from one's row is then an OR of the rows of two's 
+# friends and an AND NOT with one's row, a word at a time.
+# Time: O(edges + two's friends * vertices / 64) | Space: O(vertices^2 / 8)
+#
+# Choosing a method:
+# The matrix uses one bit for every pair of students, while the edge array of 
+# Method 3 uses 16 bytes (two int32s in both directions) for every friendship,
+# so the matrix is smaller once there's more than one friendship per 128 pairs
+# of students. configureProjectPresentationAuto uses Method 5 for graphs at
+# least that dense (as long as the matrix fits in BITSET_MAX_BYTES) and 
+# Method 3 otherwise.
+#
+# Method 6:
+# For edge files too large to load. Memory-map the file and parse it a chunk of
+# bytes at a time: digits are found with NumPy, each digit is multiplied by its
+# power of ten and every number's digits are added together in one reduction,
+# so no str (or bytes) object is ever made per number or per line. Each case 
+# reads its friendships twice. The first pass marks one's friends and two's
+# friends in boolean masks over the students, then the second pass goes back 
+# to the start of the case's friendships and marks the friends of two's 
+# friends. Only the masks and one chunk are in memory at a time, and the file
+# is unmapped once the last case is read (or the generator is closed early).
+# Time: O(edges) | Space: O(vertices + chunk size)
+#
+# Method 7:
+# For when friendships keep being added and removed, and recomputing from 
+# scratch would cost O(edges) every time. Keep everyone's friends, the set of 
+# two's friends and, for every student, how many of two's friends they are 
+# friends with. A student is invited if they're one's friend, not one or two,
+# not two's friend and that count is 0. A new friendship bumps the count of 
+# each end if the other end is one of two's friends, and a friendship with two
+# makes the other end one of two's friends, which bumps the count of all of 
+# their friends. Removing a friendship is the reverse. Only the students whose
+# counts changed are rechecked, and the sorted list of invitees is only rebuilt
+# when it's asked for after a change.
+# Time: O(degree) per change | Space: O(vertices + edges)
+
+import mmap
+import os
+from collections import defaultdict
+from typing import Iterator, List, Tuple
+
+from . import lazyImport, loader, profiler
+from .loader import parseInts
+
+# NumPy is optional, and only imported once it's used
+np = lazyImport('numpy')
+
+# Largest adjacency matrix Method 5 will build, and the fewest friendships per
+# pair of students for it to be chosen over Method 3
+BITSET_MAX_BYTES = 2 ** 28
+BITSET_MIN_DENSITY = 1 / 128
+
+def configureProjectPresentation_1(n: int, 
+                                   friendships: List[List[int]]) -> List[int]:
+    """
+    Method 1
+    """
+    # If there are only 2 students, return empty
+    if n < 3: 
+        return [-1]
+    
+    # Create adjacency matrix
+    m = [[0 for _ in range(n)] for _ in range(n)]
+    # Add each friendship to the adjacency matrix
+    for f in friendships:
+        # Make sure vertices are valid
+        if f[0] - 1 < n and f[1] - 1 < n and f[0] >= 0 and f[1] >= 0:
+            # Undirected graph, so edges going both ways (and adjust from 
+            # 1-index to 0-index)
+            m[f[0] - 1][f[1] - 1] = 1
+            m[f[1] - 1][f[0] - 1] = 1
+    
+    # Get list of two's friends
+    two_friends = [i for i in range(1, n) if m[1][i] == 1]
+    # Go through all of two's friends
+    for tf in two_friends:
+        # If friends with student 1 (index 0), remove edge from 1 to friend
+        if m[0][tf] == 1:
+            m[0][tf] = 0
+        # Go through all of tf's friends
+        for i in range(1, n):
+            # If friends with tf
+            if m[tf][i] == 1:
+                # If friends with student 1 (index 0), remove edge
+                if m[0][i] == 1:
+                    m[0][i] = 0
+    
+    # Get list of all of 1's remaining friends (excluding 2 (index 1))
+    invites = [i + 1 for i in range(1, n) if m[0][i] == 1 and not(i == 1)]
+    return invites if invites else [-1]
+
+def configureProjectPresentation(n: int, friendships: List[List[int]]) -> List[int]:
+    """
+    Method 2
+    """
+    twos_friends, twos_friends_friends = set(), set()
+    invitees = set()
+    i = 0
+    
+    # Remove all edges that are invalid (negative or > n)
+    while i < len(friendships):
+        if friendships[i][0] < 0 or friendships[i][1] < 0 or\
+           friendships[i][0] > n or friendships[i][1] > n:
+            friendships = friendships[:i] + friendships[i + 1:]
+        else:
+            i += 1
+    
+    # Add all of twos friends to a set
+    for f in friendships:
+        if f[0] == 2 and not(f[1] == 1) and not(f[1] == 2):
+            twos_friends.add(f[1])
+        if f[1] == 2 and not(f[0] == 1) and not(f[0] == 2):
+            twos_friends.add(f[0])
+    
+    # Add all of twos twos friends to a set
+    for f in friendships:
+        if f[0] in twos_friends and not(f[1] == 1) and not(f[1]) == 2 and \
+            not(f[1] in twos_friends):
+            twos_friends_friends.add(f[1])
+        if f[1] in twos_friends and not(f[0] == 1) and not(f[1]) == 2 and \
+            not(f[0] in twos_friends):
+            twos_friends_friends.add(f[0])
+    
+    # Add all of ones friends that arent twos friends or twos twos friends to set
+    for f in friendships:
+        if f[0] == 1 and not(f[1] == 1) and not(f[1] == 2) and \
+            not(f[1] in twos_friends) and not(f[1] in twos_friends_friends):
+            invitees.add(f[1])
+        if f[1] == 1 and not(f[0] == 1) and not(f[0] == 2) and \
+            not(f[0] in twos_friends) and not(f[0] in twos_friends_friends):
+            invitees.add(f[0])
+    
+    # Return sorted invitees
+    return sorted(list(invitees)) if invitees else [-1]
+
+def configureProjectPresentation_3(n: int, 
+                                   friendships: List[List[int]]) -> List[int]:
+    """
+    Method 3
+    """
+    # NumPy is optional, so fall back on Method 2 without it
+    if np is None:
+        return configureProjectPresentation(n, friendships)
+    profiler.count('friendships', len(friendships))
+    with profiler.phase('load'):
+        try:
+            edges = np.asarray(friendships, dtype=np.int32).reshape(-1, 2)
+        # Students that don't fit in int32 are invalid anyway, but still need 
+        # to be loaded to be removed
+        except OverflowError:
+            edges = np.asarray(friendships, dtype=np.int64).reshape(-1, 2)
+        # Remove all edges that are invalid (negative or > n)
+        edges = edges[((edges >= 0) & (edges <= n)).all(axis=1)]
+    with profiler.phase('mask'):
+        # Each edge in both directions, so that a friend of x is any b with 
+        # a == x
+        a = np.concatenate((edges[:, 0], edges[:, 1]))
+        b = np.concatenate((edges[:, 1], edges[:, 0]))
+        # Mask of two's friends (not counting one or two)
+        twos_friends = np.zeros(n + 1, dtype=bool)
+        twos_friends[b[a == 2]] = True
+        # (indexing only the students 1 and 2 that exist when n < 2)
+        twos_friends[[1, 2][:n]] = False
+        # Mask of everyone who can't be invited: one, two, two's friends and 
+        # their friends
+        excluded = twos_friends.copy()
+        excluded[b[twos_friends[a]]] = True
+        excluded[[1, 2][:n]] = True
+        # Mask of one's friends that aren't excluded
+        invitees = np.zeros(n + 1, dtype=bool)
+        invitees[b[a == 1]] = True
+        invitees &= ~excluded
+        # Return invitees, which are sorted since the mask is indexed by 
+        # student
+        invitees = np.flatnonzero(invitees).tolist()
+        return invitees if invitees else [-1]
+
+class FriendshipGraph:
+    """
+    Method 4
+    """
+
+    def __init__(self, n: int, friendships: List[List[int]]):
+        profiler.count('friendships', len(friendships))
+        with profiler.phase('index'):
+            self.n = n
+            edges = np.asarray(friendships, dtype=np.int64).reshape(-1, 2)
+            # Remove all edges that are invalid (negative or > n)
+            edges = edges[((edges >= 0) & (edges <= n)).all(axis=1)]
+            # Each edge in both directions, sorted by the first student
+            a = np.concatenate((edges[:, 0], edges[:, 1]))
+            b = np.concatenate((edges[:, 1], edges[:, 0]))
+            order = np.argsort(a, kind='stable')
+            self.neighbours = b[order].astype(np.int32)
+            self.offsets = np.zeros(n + 2, dtype=np.int64)
+            np.cumsum(np.bincount(a, minlength=n + 1), out=self.offsets[1:])
+            # Bitset of students seen by the current query
+            self.seen = np.zeros(n + 1, dtype=bool)
+
+    def friends(self, students: 'np.ndarray') -> 'np.ndarray':
+        """
+        Returns friends of all given students together (with repeats)
+        """
+        starts = self.offsets[students]
+        counts = self.offsets[students + 1] - starts
+        # Position of each friend in self.neighbours: its student's start plus
+        # how far along that student's friends it is
+        firsts = np.cumsum(counts) - counts
+        positions = np.arange(counts.sum()) + np.repeat(starts - firsts, counts)
+        return self.neighbours[positions]
+
+    def query(self, a: int, b: int, hops: int) -> List[int]:
+        """
+        Returns a's friends that aren't within given hops of b (not through a)
+        """
+        # Negative students would wrap around to the end of the bitset
+        if not(0 <= a <= self.n and 0 <= b <= self.n):
+            raise ValueError("students must be from 0 to {0}".format(self.n))
+        # Search outwards from b, never stepping onto a
+        frontier = np.array([b], dtype=np.int64)
+        self.seen[[a, b]] = True
+        marked = [frontier, np.array([a])]
+        try:
+            for _ in range(hops):
+                if not(len(frontier)):
+                    break
+                friends = self.friends(frontier)
+                frontier = np.unique(friends[~self.seen[friends]])
+                self.seen[frontier] = True
+                marked.append(frontier)
+            friends = np.unique(self.friends(np.array([a], dtype=np.int64)))
+            return friends[~self.seen[friends]].tolist()
+        finally:
+            # Clear only the students this query marked, even if it failed, so
+            # that the graph can still be reused
+            for students in marked:
+                self.seen[students] = False
+
+    def queryBatch(self, queries: List[Tuple[int, int, int]]) -> List[List[int]]:
+        """
+        Returns answer to each (a, b, hops) query
+        """
+        return [self.query(a, b, hops) for a, b, hops in queries]
+
+def configureProjectPresentation_4(n: int, 
+                                   friendships: List[List[int]]) -> List[int]:
+    """
+    Method 4
+    """
+    # NumPy is optional, so fall back on Method 2 without it
+    if np is None or n < 2:
+        return configureProjectPresentation(n, loader.asList(friendships))
+    graph = FriendshipGraph(n, friendships)
+    with profiler.phase('query'):
+        invitees = graph.query(1, 2, 2)
+    return invitees if invitees else [-1]
+
+def configureProjectPresentation_5(n: int, 
+                                   friendships: List[List[int]]) -> List[int]:
+    """
+    Method 5
+    """
+    # NumPy is optional, so fall back on Method 2 without it
+    if np is None or n < 2:
+        return configureProjectPresentation(n, loader.asList(friendships))
+    profiler.count('friendships', len(friendships))
+    with profiler.phase('index'):
+        edges = np.asarray(friendships, dtype=np.int64).reshape(-1, 2)
+        # Remove all edges that are invalid (negative or > n)
+        edges = edges[((edges >= 0) & (edges <= n)).all(axis=1)]
+        a = np.concatenate((edges[:, 0], edges[:, 1]))
+        b = np.concatenate((edges[:, 1], edges[:, 0]))
+        # Create adjacency matrix, where student b is bit b % 64 of word b // 64
+        words = (n + 1 + 63) // 64
+        m = np.zeros((n + 1, words), dtype=np.uint64)
+        np.bitwise_or.at(m, (a, b // 64), 
+                         np.left_shift(1, b % 64).astype(np.uint64))
+    # Students 1 and 2 as a row of bits
+    one_two = np.zeros(words, dtype=np.uint64)
+    one_two[0] = 0b110
+    # Two's friends (not counting one or two) and all of their friends
+    two_friends = m[2] & ~one_two
+    two_friends_ids = np.flatnonzero(np.unpackbits(
+        two_friends.astype('<u8').view(np.uint8), bitorder='little'))
+    excluded = two_friends | one_two | np.bitwise_or.reduce(m[two_friends_ids])
+    # Remove them from one's row
+    invites = m[1] & ~excluded
+    # Get list of all of 1's remaining friends
+    invites = np.flatnonzero(np.unpackbits(invites.astype('<u8').view(np.uint8),
+                                           bitorder='little')).tolist()
+    return invites if invites else [-1]
+
+def configureProjectPresentationAuto(n: int, 
+                                     friendships: List[List[int]]) -> List[int]:
+    """
+    Uses Method 5 for dense graphs and Method 3 for sparse ones
+    """
+    matrix_bytes = (n + 1) * ((n + 1 + 63) // 64) * 8
+    if matrix_bytes <= BITSET_MAX_BYTES and \
+       len(friendships) >= BITSET_MIN_DENSITY * (n + 1) ** 2:
+        return configureProjectPresentation_5(n, friendships)
+    return configureProjectPresentation_3(n, friendships)
+
+class IntStream:
+    """
+    Reads whitespace separated integers from a file one chunk at a time
+    """
+
+    def __init__(self, path: str, chunk_size: int = 2 ** 20):
+        self.chunk_size = chunk_size
+        with open(path, 'rb') as f:
+            # Empty files can't be memory-mapped
+            self.buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) \
+                       if os.fstat(f.fileno()).st_size else b''
+        self.start = self.pos = -1
+        self.seek(0)
+
+    def __enter__(self) -> 'IntStream':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """
+        Unmaps the file, after which the stream reads as if it were empty
+        """
+        if isinstance(self.buf, mmap.mmap):
+            self.buf.close()
+        self.buf = b''
+
+    def seek(self, pos: int):
+        """
+        Moves to a byte offset in the file
+        """
+        # If the offset is inside the last parsed chunk, skip to the first
+        # value after it instead of parsing the chunk again
+        if self.start <= pos <= self.pos:
+            self.i = int(np.searchsorted(self.ends, pos, side='right'))
+            return
+        # Where the parsed chunk starts and ends, and its values (and where 
+        # they end), of which the first i have been read
+        self.start, self.pos, self.values, self.ends, self.i = pos, pos, [], [], 0
+
+    def tell(self) -> int:
+        """
+        Returns byte offset just after the last integer read
+        """
+        return self.ends[self.i - 1] if self.i else self.pos
+
+    def read(self, count: int) -> 'np.ndarray':
+        """
+        Returns up to count integers (fewer at the end of a chunk or file)
+        """
+        while self.i == len(self.values) and self.pos < len(self.buf):
+            end = min(self.pos + self.chunk_size, len(self.buf))
+            # Grow the chunk until it ends on whitespace so no number is cut
+            while end < len(self.buf) and self.buf[end - 1] not in b' \t\r\n':
+                end = min(end + self.chunk_size, len(self.buf))
+            values, ends = parseInts(self.buf[self.pos:end])
+            self.start, self.pos, self.values, self.ends, self.i = \
+                self.pos, end, values, ends + self.pos, 0
+        values = self.values[self.i:self.i + count]
+        self.i += len(values)
+        return values
+
+    def pairs(self, count: int) -> Iterator['np.ndarray']:
+        """
+        Yields the next count pairs of integers as (pairs x 2) arrays
+        """
+        left, carry = 2 * count, np.zeros(0, dtype=np.int64)
+        while left:
+            values = self.read(left)
+            if not(len(values)):
+                raise ValueError("File ended before {0} more integers".format(
+                                 left))
+            left -= len(values)
+            # Keep an odd integer at the end of the chunk for the next pair
+            values = np.concatenate((carry, values))
+            carry = values[len(values) // 2 * 2:]
+            yield values[:len(values) // 2 * 2].reshape(-1, 2)
+
+def configureProjectPresentationStream(path: str, 
+                                       chunk_size: int = 2 ** 20
+                                       ) -> Iterator[List[int]]:
+    """
+    Method 6
+    """
+    with IntStream(path, chunk_size) as stream:
+        yield from configureStreamCases(stream)
+
+def configureStreamCases(stream: IntStream) -> Iterator[List[int]]:
+    """
+    Yields invitees of each case read from an open stream for Method 6
+    """
+    cases, = stream.read(1)
+    for _ in range(cases):
+        n, m = stream.read(1)[0], stream.read(1)[0]
+        start = stream.tell()
+        ones_friends = np.zeros(n + 1, dtype=bool)
+        twos_friends = np.zeros(n + 1, dtype=bool)
+        excluded = np.zeros(n + 1, dtype=bool)
+        # Read friendships twice: first for one's and two's friends, then for
+        # two's friends' friends
+        for mark_twos_friends in (False, True):
+            stream.seek(start)
+            for edges in stream.pairs(m):
+                # Remove all edges that are invalid (negative or > n)
+                edges = edges[((edges >= 0) & (edges <= n)).all(axis=1)]
+                for a, b in ((edges[:, 0], edges[:, 1]), 
+                             (edges[:, 1], edges[:, 0])):
+                    if mark_twos_friends:
+                        excluded[b[twos_friends[a]]] = True
+                    else:
+                        ones_friends[b[a == 1]] = True
+                        twos_friends[b[a == 2]] = True
+            # Two's friends don't count one or two (indexing only the students
+            # 1 and 2 that exist when n < 2)
+            twos_friends[[1, 2][:n]] = False
+        excluded |= twos_friends
+        excluded[[1, 2][:n]] = True
+        invitees = np.flatnonzero(ones_friends & ~excluded).tolist()
+        yield invitees if invitees else [-1]
+
+class InviteList:
+    """
+    Method 7
+    """
+
+    def __init__(self, n: int, friendships: List[List[int]] = ()):
+        self.n = n
+        # Everyone's friends, with how many times each friendship was added
+        self.friends = defaultdict(lambda: defaultdict(int))
+        self.twos_friends = set()
+        # How many of two's friends each student is friends with
+        self.twos_friends_count = defaultdict(int)
+        self.invitees, self.sorted_invitees = set(), [-1]
+        for a, b in friendships:
+            self.add(a, b)
+
+    def add(self, a: int, b: int):
+        """
+        Adds a friendship
+        """
+        # Ignore edges that are invalid (negative or > n)
+        if not(0 <= a <= self.n and 0 <= b <= self.n):
+            return
+        self.friends[a][b] += 1
+        if not(a == b):
+            self.friends[b][a] += 1
+        # Only a new friendship (not a repeat) changes anything
+        if self.friends[a][b] == 1:
+            self.update(a, b, 1)
+
+    def remove(self, a: int, b: int):
+        """
+        Removes a friendship that was added before
+        """
+        if not(0 <= a <= self.n and 0 <= b <= self.n):
+            return
+        if not(self.friends[a].get(b)):
+            raise ValueError("{0} was never added".format([a, b]))
+        # Only removing the last copy of a friendship changes anything
+        if self.friends[a][b] == 1:
+            self.update(a, b, -1)
+        else:
+            for x, y in {(a, b), (b, a)}:
+                self.friends[x][y] -= 1
+
+    def update(self, a: int, b: int, change: int):
+        """
+        Updates counts and invitees for a friendship that's new (change = 1)
+        or being removed for good (change = -1)
+        """
+        # Whoever becomes or stops being one of two's friends, and everyone
+        # whose count changes
+        changed = {a, b}
+        other = b if a == 2 else a if b == 2 else None
+        # A friendship with two being removed, so two's friend's friends each
+        # lose one (while the friendship is still there)
+        if change == -1 and other in self.twos_friends:
+            self.twos_friends.remove(other)
+            for friend in self.friends[other]:
+                self.twos_friends_count[friend] -= 1
+            changed.update(self.friends[other])
+        # Each end is friends with one more or one less of two's friends
+        for x, y in {(a, b), (b, a)}:
+            if x in self.twos_friends:
+                self.twos_friends_count[y] += change
+        # A friendship with two being added, so two's friend's friends each 
+        # gain one (including the new friendship)
+        if change == 1 and other is not None and not(other in (1, 2)):
+            self.twos_friends.add(other)
+            for friend in self.friends[other]:
+                self.twos_friends_count[friend] += 1
+            changed.update(self.friends[other])
+        # Removed friendships are only deleted once the counts are updated
+        if change == -1:
+            for x, y in {(a, b), (b, a)}:
+                del self.friends[x][y]
+        for student in changed:
+            self.check(student)
+
+    def check(self, student: int):
+        """
+        Adds or removes a student from the invitees
+        """
+        # Invited if friends with one, not one or two, not one of two's 
+        # friends and not friends with any of them
+        invited = bool(self.friends[1].get(student)) and \
+                  not(student in (1, 2)) and \
+                  not(student in self.twos_friends) and \
+                  not(self.twos_friends_count[student])
+        # Only rebuild sorted invitees when they're asked for after a change
+        if invited and not(student in self.invitees):
+            self.invitees.add(student)
+            self.sorted_invitees = None
+        elif not(invited) and student in self.invitees:
+            self.invitees.remove(student)
+            self.sorted_invitees = None
+
+    def invites(self) -> List[int]:
+        """
+        Returns sorted invitees
+        """
+        if self.sorted_invitees is None:
+            self.sorted_invitees = sorted(self.invitees) or [-1]
+        return self.sorted_invitees
+
+def configureProjectPresentation_7(n: int, 
+                                   friendships: List[List[int]]) -> List[int]:
+    """
+    Method 7
+    """
+    return InviteList(n, friendships).invites()
+
+# Every method by name, so that one can be picked on the command line (Method 6
+# isn't one of them since it reads the file itself)
+METHODS = {
+    'configureProjectPresentation_1': configureProjectPresentation_1,
+    'configureProjectPresentation': configureProjectPresentation,
+    'configureProjectPresentation_3': configureProjectPresentation_3,
+    'configureProjectPresentation_4': configureProjectPresentation_4,
+    'configureProjectPresentation_5': configureProjectPresentation_5,
+    'configureProjectPresentationAuto': configureProjectPresentationAuto,
+    'configureProjectPresentation_7': configureProjectPresentation_7
+}
+
+# Methods that convert friendships to a NumPy array themselves, so they're 
+# given the loader's array rather than lists
+ARRAY_METHODS = {METHODS[name] for name in (
+    'configureProjectPresentation_3', 'configureProjectPresentation_4', 
+    'configureProjectPresentation_5', 'configureProjectPresentationAuto')}
+
+def main(argv: List[str]):
+    """
+    Solves a test case from the command line (see loader.main)
+    """
+    loader.main(argv, loader.parseProjectManagement, 
+                lambda method, cases: (
+                    ' '.join(map(str, method(n, loader.asList(
+                        edges, method in ARRAY_METHODS))))
+                    for n, edges in cases),
+                METHODS, 'configureProjectPresentationAuto')
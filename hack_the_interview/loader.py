@@ -0,0 +1,288 @@
+# Loader
+# Hack the Interview II - April 2020
+# ---------------------------------- Purpose -----------------------------------
+# Shared input and output for the solutions, so that they can be run on
+# HackerRank's test cases (some of them several MB of integers) without reading
+# them line by line with input().split(), which takes longer than most of the
+# algorithms do.
+# ---------------------------------- Solution ----------------------------------
+# Read the whole input at once, memory-mapping it when it's a file and reading
+# all of sys.stdin.buffer otherwise. Then parse every integer in one go with
+# NumPy: subtract '0' from every byte so that digits are the only bytes below
+# 10, find where each run of digits starts and ends, and add up each digit
+# times its power of ten with a single reduceat. Each problem's format is then
+# just slicing and reshaping that array into value arrays, query pairs and
+# edge lists. Answers are written with one join and one write.
+#
+# run() times parsing, solving and writing separately and reports them on
+# stderr, so that it's easy to tell whether the parsing or the algorithm is
+# the slow part.
+#
+# Formats:
+# Product Distribution: n and m, then the n integers
+# Maximal Char Requests: n, the string, the number of queries q, then q pairs
+# Configuring Project Management: the number of cases t, then for each case n
+# and the number of friendships m followed by m pairs
+# Minimum String Coefficient: n and p, then the binary string (its test cases
+# weren't made available, so this is the same shape as the others)
+#
+# Binary formats (written by generate.py) start with MAGIC, then hold the same
+# things in the same order as little-endian int64s, except that queries and
+# friendships are int32 pairs, the string of Maximal Char Requests is its raw 
+# bytes, and the string of Minimum String Coefficient is its bits packed 8 to a
+# byte (first bit as the highest bit of the first byte). Every parse function 
+# accepts either format.
+# Time: O(input size) | Space: O(input size)
+
+import mmap
+import re
+import sys
+from array import array
+from time import perf_counter
+from typing import Callable, Dict, IO, Iterable, List, Tuple, Union
+
+from . import lazyImport, profiler
+
+# NumPy is optional, and only imported once it's used
+np = lazyImport('numpy')
+
+MAGIC = b'HTI2BIN\n'
+
+class BinaryReader:
+    """
+    Reads integers and bytes from a binary test case, after MAGIC
+    """
+
+    def __init__(self, buf: bytes):
+        self.buf, self.pos = memoryview(buf), len(MAGIC)
+
+    def read(self, count: int) -> memoryview:
+        """
+        Returns the next count bytes
+        """
+        chunk = self.buf[self.pos:self.pos + count]
+        if len(chunk) < count:
+            raise ValueError("Binary test case ended {0} bytes early".format(
+                             count - len(chunk)))
+        self.pos += count
+        return chunk
+
+    def ints(self, count: int, code: str = 'q') -> Union['np.ndarray', array]:
+        """
+        Returns the next count little-endian integers of the given array 
+        typecode ('q' for int64, 'i' for int32)
+        """
+        chunk = self.read(array(code).itemsize * int(count))
+        # NumPy is optional, so copy into an array without it
+        if np is None:
+            values = array(code, bytes(chunk))
+            if sys.byteorder == 'big':
+                values.byteswap()
+            return values
+        return np.frombuffer(chunk, dtype='<' + code)
+
+def isBinary(buf: bytes) -> bool:
+    """
+    Checks whether a test case is in the binary format
+    """
+    return bytes(buf[:len(MAGIC)]) == MAGIC
+
+def readInput(source: str = None) -> Union[bytes, mmap.mmap]:
+    """
+    Reads a whole file (or standard input if there's no file or it is '-')
+    """
+    if source is None or source == '-':
+        return sys.stdin.buffer.read()
+    with open(source, 'rb') as f:
+        # Empty files can't be memory-mapped
+        f.seek(0, 2)
+        if not(f.tell()):
+            return b''
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+def parseInts(buf: bytes) -> Tuple['np.ndarray', 'np.ndarray']:
+    """
+    Parses whitespace separated integers, returning their values and the index
+    just after each one
+    """
+    chars = np.frombuffer(buf, dtype=np.uint8)
+    # Digits wrap around to large values when anything below '0' is subtracted
+    digits = chars - ord('0')
+    is_digit = digits < 10
+    is_number = is_digit | (chars == ord('-'))
+    # Indices where numbers start and end (exclusive)
+    edges = np.diff(is_number.astype(np.int8), prepend=0, append=0)
+    starts, ends = np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+    # Power of ten of each digit is its distance from the end of its number
+    number_ids = np.cumsum(edges[:-1] == 1) - 1
+    positions = np.flatnonzero(is_number)
+    powers = ends[number_ids[positions]] - 1 - positions
+    values = np.where(is_digit[positions], digits[positions], 0) * \
+             np.power(10, powers, dtype=np.int64)
+    # Add up the digits of each number, which are next to each other in values
+    if not(len(starts)):
+        return np.zeros(0, dtype=np.int64), ends
+    lengths = ends - starts
+    values = np.add.reduceat(values, np.cumsum(lengths) - lengths)
+    values[chars[starts] == ord('-')] *= -1
+    return values, ends
+
+def readInts(buf: bytes) -> Union['np.ndarray', array]:
+    """
+    Parses whitespace separated integers into an array
+    """
+    # NumPy is optional, so split and convert each integer without it
+    if np is None:
+        return array('q', map(int, bytes(buf).split()))
+    return parseInts(buf)[0]
+
+def asList(values: Union['np.ndarray', array, list], 
+           keep_arrays: bool = False) -> Union['np.ndarray', list]:
+    """
+    Converts an array to (nested) lists of Python integers, unless keep_arrays 
+    is set and it's a NumPy array (for methods that convert it to one anyway)
+    """
+    if keep_arrays and np is not None and isinstance(values, np.ndarray):
+        return values
+    return values.tolist() if hasattr(values, 'tolist') else values
+
+def toPairs(values: Union['np.ndarray', array]) -> Union['np.ndarray', list]:
+    """
+    Groups integers into (pairs x 2), as an array or a list of lists
+    """
+    if np is None:
+        return [list(values[i:i + 2]) for i in range(0, len(values), 2)]
+    return values.reshape(-1, 2)
+
+def parseProductDistribution(buf: bytes) -> Tuple['np.ndarray', int]:
+    """
+    Returns the integers and m
+    """
+    if isBinary(buf):
+        reader = BinaryReader(buf)
+        n, m = reader.ints(2)
+        return reader.ints(n), int(m)
+    values = readInts(buf)
+    n, m = values[0], values[1]
+    return values[2:2 + n], int(m)
+
+def parseMaximalChar(buf: bytes) -> Tuple[str, 'np.ndarray']:
+    """
+    Returns the string and its queries
+    """
+    if isBinary(buf):
+        reader = BinaryReader(buf)
+        s = bytes(reader.read(int(reader.ints(1)[0]))).decode()
+        return s, toPairs(reader.ints(2 * reader.ints(1)[0], 'i'))
+    # The string is the only thing that isn't an integer, so find it first and
+    # parse everything after it (without copying the buffer). It's the whole
+    # line after n, which may be empty
+    match = re.match(rb'\s*\d+[ \t]*\r?\n([^\r\n]*)', buf)
+    values = readInts(memoryview(buf)[match.end():])
+    q = values[0]
+    return match.group(1).decode(), toPairs(values[1:1 + 2 * q])
+
+def parseProjectManagement(buf: bytes) -> List[Tuple[int, 'np.ndarray']]:
+    """
+    Returns n and the friendships of every case
+    """
+    if isBinary(buf):
+        reader, cases = BinaryReader(buf), []
+        for _ in range(reader.ints(1)[0]):
+            n, m = reader.ints(2)
+            cases.append((int(n), toPairs(reader.ints(2 * m, 'i'))))
+        return cases
+    values = readInts(buf)
+    cases, i = [], 1
+    for _ in range(values[0]):
+        n, m = int(values[i]), int(values[i + 1])
+        cases.append((n, toPairs(values[i + 2:i + 2 + 2 * m])))
+        i += 2 + 2 * m
+    return cases
+
+def parseStringCoeff(buf: bytes) -> Tuple[str, int]:
+    """
+    Returns the binary string and p
+    """
+    if isBinary(buf):
+        reader = BinaryReader(buf)
+        n, p = (int(x) for x in reader.ints(2))
+        packed = reader.read((n + 7) // 8)
+        # NumPy is optional, so unpack through a Python integer without it
+        if np is None:
+            s = bin(int.from_bytes(packed, 'big'))[2:].zfill(len(packed) * 8)
+            return s[:n], p
+        bits = np.unpackbits(np.frombuffer(packed, dtype=np.uint8), count=n)
+        return (bits + ord('0')).tobytes().decode(), p
+    match = re.match(rb'\s*\d+\s+(\d+)\s+([01]*)', buf)
+    return match.group(2).decode(), int(match.group(1))
+
+def writeOutput(lines: Iterable, out: IO[bytes] = None):
+    """
+    Writes one answer per line with a single write
+    """
+    out = out or sys.stdout.buffer
+    out.write(''.join(str(line) + '\n' for line in lines).encode())
+    out.flush()
+
+def run(parse: Callable[[bytes], object], solve: Callable[[object], Iterable],
+        source: str = None, out: IO[bytes] = None) -> Dict[str, float]:
+    """
+    Parses a test case, solves it and writes its answers, reporting how long
+    each of them took on stderr
+    """
+    times = {}
+    start = perf_counter()
+    with profiler.phase('parse'):
+        case = parse(readInput(source))
+    times['parse'] = perf_counter() - start
+    start = perf_counter()
+    # Solve everything before writing so that solving is timed on its own
+    with profiler.phase('solve'):
+        lines = list(solve(case))
+    times['solve'] = perf_counter() - start
+    start = perf_counter()
+    with profiler.phase('write'):
+        writeOutput(lines, out)
+    times['write'] = perf_counter() - start
+    print(", ".join("{0} {1:.3f}s".format(name, t) for name, t in times.items()),
+          file=sys.stderr)
+    return times
+
+def main(argv: List[str], parse: Callable[[bytes], object],
+         solve: Callable[[Callable, object], Iterable],
+         methods: Dict[str, Callable], default: str):
+    """
+    Solves the test case given on the command line with one of a solution's
+    methods (solve(method, case) returns its output lines), profiling it if 
+    asked to
+    """
+    # Imported here so that importing a solution doesn't import argparse
+    import argparse
+    parser = argparse.ArgumentParser(description="Solves a test case")
+    parser.add_argument('input', help="test case file, or '-' for standard "
+                        "input")
+    parser.add_argument('method', nargs='?', default=default, 
+                        choices=list(methods))
+    parser.add_argument('--report', help="save time (and memory) of each "
+                        "phase and counters here as JSON")
+    parser.add_argument('--memory', action='store_true', 
+                        help="trace memory for the report")
+    profilers = parser.add_mutually_exclusive_group()
+    profilers.add_argument('--cprofile', help="save cProfile stats here")
+    profilers.add_argument('--stacks', help="save sampled stacks here in "
+                           "folded format for flame graphs")
+    args = parser.parse_args(argv)
+    method = methods[args.method]
+    if args.report:
+        profiler.enable(args.memory)
+    if args.cprofile:
+        profiler.cprofile(args.cprofile, run, parse, 
+                          lambda case: solve(method, case), args.input)
+    elif args.stacks:
+        profiler.sampleStacks(args.stacks, run, parse, 
+                              lambda case: solve(method, case), args.input)
+    else:
+        run(parse, lambda case: solve(method, case), args.input)
+    if args.report:
+        profiler.writeReport(args.report)
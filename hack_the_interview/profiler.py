@@ -0,0 +1,182 @@
+# Profiler
+# Hack the Interview II - April 2020
+# ---------------------------------- Purpose -----------------------------------
+# When a solution is slow, shows where the time (and memory) goes: parsing,
+# building an index (the letter indices of Maximal Char Requests, the chunks of
+# Minimum String Coefficient, the sort of Product Distribution...), answering
+# queries or writing the output.
+# ---------------------------------- Solution ----------------------------------
+# The solutions mark their steps with phase('name') and count what they work
+# on with count('name', amount). Both do nothing but check a flag until
+# enable() is called, so they can stay in the code. When enabled, each phase
+# adds up its time and calls under its full name (phases inside other phases
+# are named 'outer/inner'), and with memory=True tracemalloc records the peak
+# memory allocated during each phase and the lines that allocated the most.
+# report() returns all of it as a dictionary, and writeReport() saves it as
+# JSON.
+#
+# For a closer look at a single run, cprofile() saves cProfile's stats for
+# pstats or snakeviz, and sampleStacks() samples the call stack every
+# millisecond from another thread and saves how often each stack was seen in
+# the folded format of flamegraph.pl and speedscope ('outer;inner count').
+
+import json
+import sys
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from time import perf_counter
+from typing import Callable, Dict, Iterator
+
+from . import lazyImport
+
+# Only imported once profiling is asked for, since every solution imports this
+cProfile = lazyImport('cProfile')
+threading = lazyImport('threading')
+tracemalloc = lazyImport('tracemalloc')
+
+# Whether phases and counters are recorded, and whether memory is too
+enabled, tracing = False, False
+# Total seconds, calls and peak bytes of each phase, and total of each counter
+phases, counters = {}, Counter()
+# Names of the phases that are running, outermost first, and their peak memory
+# so far (after the peak of everything outside of any phase)
+running, peaks = [], [0]
+# A phase that does nothing, for when recording is disabled
+disabled_phase = nullcontext()
+
+def enable(memory: bool = False):
+    """
+    Starts recording phases and counters (and memory if asked to)
+    """
+    global enabled, tracing
+    enabled, tracing = True, memory
+    if memory and not(tracemalloc.is_tracing()):
+        tracemalloc.start()
+
+def disable():
+    """
+    Stops recording, keeping what's been recorded so far
+    """
+    global enabled, tracing
+    enabled, tracing = False, False
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+def reset():
+    """
+    Forgets everything recorded so far
+    """
+    phases.clear()
+    counters.clear()
+    peaks[0] = 0
+
+def phase(name: str):
+    """
+    Returns a context manager that times everything inside it under name
+    """
+    if not(enabled):
+        return disabled_phase
+    return recordPhase(name)
+
+@contextmanager
+def recordPhase(name: str) -> Iterator[None]:
+    running.append(name)
+    full_name = '/'.join(running)
+    if tracing:
+        # tracemalloc only has one peak, which is reset for this phase, so the
+        # phase this one is inside of keeps its peak so far on the stack
+        peaks[-1] = max(peaks[-1], tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+        peaks.append(0)
+        start_memory = tracemalloc.get_traced_memory()[0]
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        seconds = perf_counter() - start
+        running.pop()
+        stats = phases.setdefault(full_name, {'seconds': 0, 'calls': 0})
+        stats['seconds'] += seconds
+        stats['calls'] += 1
+        if tracing:
+            peak = max(peaks.pop(), tracemalloc.get_traced_memory()[1])
+            stats['peak_bytes'] = max(stats.get('peak_bytes', 0),
+                                      peak - start_memory)
+            peaks[-1] = max(peaks[-1], peak)
+
+def count(name: str, amount: int = 1):
+    """
+    Adds amount to the counter called name
+    """
+    if enabled:
+        counters[name] += amount
+
+def report(top: int = 10) -> Dict[str, object]:
+    """
+    Returns phases, counters and (when tracing memory) the top lines that
+    allocated memory still in use
+    """
+    res = {'phases': {name: dict(stats) for name, stats in phases.items()},
+           'counters': dict(counters)}
+    if tracemalloc.is_tracing():
+        current, peak = tracemalloc.get_traced_memory()
+        res['memory'] = {'current_bytes': current,
+                         'peak_bytes': max(peak, peaks[0])}
+        # Leave out what the profiler allocated itself
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+                   [tracemalloc.Filter(False, __file__),
+                    tracemalloc.Filter(False, tracemalloc.__file__)])
+        res['memory']['top_lines'] = [
+            {'line': str(stat.traceback[0]), 'bytes': stat.size,
+             'blocks': stat.count}
+            for stat in snapshot.statistics('lineno')[:top]]
+    return res
+
+def writeReport(path: str):
+    """
+    Saves report as JSON
+    """
+    with open(path, 'w') as f:
+        json.dump(report(), f, indent=2)
+
+def cprofile(path: str, func: Callable, *args, **kwargs):
+    """
+    Runs func under cProfile and saves its stats to path
+    """
+    profile = cProfile.Profile()
+    try:
+        return profile.runcall(func, *args, **kwargs)
+    finally:
+        profile.dump_stats(path)
+
+def sampleStacks(path: str, func: Callable, *args, interval: float = 0.001,
+                 **kwargs):
+    """
+    Runs func while sampling its call stack, and saves the folded stacks to
+    path
+    """
+    thread_id, samples, done = threading.get_ident(), Counter(), \
+                               threading.Event()
+
+    def sample():
+        while not(done.wait(interval)):
+            frame = sys._current_frames().get(thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append('{0} ({1}:{2})'.format(
+                             code.co_name, code.co_filename,
+                             code.co_firstlineno))
+                frame = frame.f_back
+            samples[';'.join(reversed(stack))] += 1
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        done.set()
+        sampler.join()
+        with open(path, 'w') as f:
+            for stack, total in samples.items():
+                f.write('{0} {1}\n'.format(stack, total))
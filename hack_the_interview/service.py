@@ -0,0 +1,475 @@
+# Solver Service
+# Hack the Interview II - April 2020
+# ---------------------------------- Purpose -----------------------------------
+# Solving a test case from the command line pays for starting Python, importing
+# the solution and building its index every time, which takes far longer than
+# answering a small batch of queries does. This keeps the solutions running in
+# a server that answers batches of cases over a Unix socket (or TCP on
+# localhost), with the indices of recently seen strings and graphs kept warm.
+# ---------------------------------- Solution ----------------------------------
+# Requests and responses are JSON, one per line:
+#     {"id": 1, "problem": "maximal-char-requests",
+#      "cases": [["aAabBcba", [[2, 6], [1, 2]]]]}
+#     {"id": 1, "results": [[1, 2]]}
+# Each case is the arguments of the solution's methods (a and m, s and
+# queries, n and friendships, or s and p), and "method" can name one of the
+# solution's METHODS to use instead of the warm index. {"id": 2, "metrics":
+# true} returns the latency metrics, and a request that fails gets "error"
+# instead of "results". Responses can come back out of order, so they're
+# matched to requests by id.
+#
+# Batches are solved in worker processes, each of which keeps its own indices:
+# Method 7's CharIndexCache of letter tables for Maximal Char Requests, and an
+# LRU of Method 4's FriendshipGraph, the Sweep Method's SortedProducts and the
+# Boundary Method's boundary positions for the others. Each case is sent to the
+# worker picked by a hash of its string, list or graph, so that a string that
+# comes up again finds its index already built in the worker it goes to. A
+# worker that dies is replaced (without its indices) and its batch is tried
+# once more in the new one.
+#
+# Backpressure: at most max_pending batches are solved or waiting at once, and
+# the server stops reading requests while it's full, so that a client that
+# sends faster than the workers can keep up is slowed down by its socket
+# instead of filling the server's memory. Latency (from reading a request to
+# having its results) is kept for the last window requests of each problem,
+# and reported as p50 and p99.
+#
+# LocalClient sends requests to a service in the same process without a socket,
+# for tests, and Client is the same over a socket.
+#
+# Usage:
+# python -m hack_the_interview serve [--socket PATH | --port PORT]
+#                                    [--workers N] [--max-pending N]
+
+import asyncio
+import json
+import os
+from array import array
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import BrokenExecutor, Executor, ProcessPoolExecutor, \
+                                ThreadPoolExecutor
+from hashlib import blake2b
+from itertools import chain
+from math import ceil
+from time import perf_counter
+from typing import Callable, Dict, List, Optional
+
+from . import configuring_project_management as configuring
+from . import maximal_char_requests as maximal
+from . import minimum_string_coefficient as minstring
+from . import product_distribution as products
+
+# Solutions by the command line names of their problems
+MODULES = {
+    'product-distribution': products,
+    'maximal-char-requests': maximal,
+    'configuring-project-management': configuring,
+    'minimum-string-coefficient': minstring
+}
+# Most indices each worker keeps of each problem, and most bytes of letter
+# tables
+MAX_INDICES = 32
+MAX_TABLE_BYTES = 2 ** 28
+# Longest request line, in bytes
+MAX_REQUEST_BYTES = 2 ** 30
+
+# Indices of this process (one of the workers), least recently used first
+indices = defaultdict(OrderedDict)
+tables = maximal.CharIndexCache(MAX_TABLE_BYTES)
+
+def warmUp():
+    """
+    Imports NumPy when a worker starts, so that its first batch doesn't wait
+    """
+    if maximal.np is not None:
+        maximal.np.zeros(0)
+
+def warmIndex(problem: str, data: bytes, build: Callable[[], object]):
+    """
+    Returns index of given data, building it if this worker doesn't have it
+    """
+    key, cache = blake2b(data, digest_size=16).digest(), indices[problem]
+    if key in cache:
+        cache.move_to_end(key)
+    else:
+        cache[key] = build()
+        if len(cache) > MAX_INDICES:
+            cache.popitem(last=False)
+    return cache[key]
+
+def packInts(values: List[int]) -> bytes:
+    """
+    Returns integers as bytes, for telling lists apart
+    """
+    # Packing is a few times faster than repr, but only fits int64, and the
+    # first byte keeps the two kinds of key from ever matching
+    try:
+        return b'q' + array('q', values).tobytes()
+    except OverflowError:
+        return b'r' + repr(values).encode()
+
+def solveCase(problem: str, case: list):
+    """
+    Solves one case using this worker's warm index
+    """
+    if problem == 'product-distribution':
+        a, m = case
+        return warmIndex(problem, packInts(a),
+                         lambda: products.SortedProducts(a)).maxScore(m)
+    if problem == 'maximal-char-requests':
+        s, queries = case
+        return maximal.getMaxCharCount_7(s, queries, tables)
+    if problem == 'configuring-project-management':
+        n, friendships = case
+        # FriendshipGraph needs NumPy and students 1 and 2
+        if configuring.np is None or n < 2:
+            return configuring.configureProjectPresentation(n, friendships)
+        graph = warmIndex(problem, packInts(list(chain([n], *friendships))),
+                          lambda: configuring.FriendshipGraph(n, friendships))
+        invitees = graph.query(1, 2, 2)
+        return invitees if invitees else [-1]
+    s, p = case
+    # The boundaries are kept rather than the chunks, so each p only costs
+    # its own 2p + 1 subtractions
+    bounds = warmIndex(problem, s.encode('utf-8', 'surrogatepass'),
+                       lambda: minstring.chunkBounds(
+                           minstring.condenseString(s)))
+    return minstring.boundsCoeff(bounds, p)
+
+def solveBatch(problem: str, method: Optional[str], cases: List[list]) -> list:
+    """
+    Solves cases in a worker, with the named method or the warm index
+    """
+    if method is None:
+        return [solveCase(problem, case) for case in cases]
+    solve = MODULES[problem].METHODS[method]
+    return [solve(*case) for case in cases]
+
+def routeKey(problem: str, case: list) -> int:
+    """
+    Returns hash of what a case's index is built from, for picking its worker
+    """
+    if problem == 'configuring-project-management':
+        n, data = case
+    else:
+        n, data = None, case[0]
+    if isinstance(data, str):
+        return hash(data)
+    # Lists are told apart by their length and ends, which is enough to send
+    # the same list to the same worker without hashing all of it
+    return hash((n, len(data), repr(data[:4]), repr(data[-4:])))
+
+def percentile(values: List[float], q: float) -> float:
+    """
+    Returns the q-th quantile (nearest rank) of sorted values
+    """
+    return values[max(0, ceil(q * len(values)) - 1)]
+
+class SolverService:
+    """
+    Answers batches of cases from worker processes with warm indices
+    """
+
+    def __init__(self, workers: int = None, max_pending: int = 64,
+                 window: int = 10000):
+        # With no workers, batches are solved in a thread of this process
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.executors: List[Executor] = []
+        # How many workers have died and been replaced
+        self.restarts = 0
+        self.pending = asyncio.Semaphore(max_pending)
+        self.in_flight = 0
+        self.latencies = defaultdict(lambda: deque(maxlen=window))
+        self.counts = defaultdict(lambda: [0, 0, 0])
+
+    def start(self):
+        """
+        Starts the workers
+        """
+        if not(self.executors):
+            # One process per worker, so that each case goes to the worker
+            # that has its index
+            self.executors = [self.startWorker() for _ in
+                              range(max(self.workers, 1))]
+
+    def startWorker(self) -> Executor:
+        """
+        Starts one worker process (or thread, with no workers)
+        """
+        executor = ProcessPoolExecutor(1) if self.workers else \
+                   ThreadPoolExecutor(1)
+        # Start it now rather than on its first batch
+        executor.submit(warmUp)
+        return executor
+
+    def close(self):
+        """
+        Stops the workers
+        """
+        for executor in self.executors:
+            executor.shutdown(cancel_futures=True)
+        self.executors = []
+
+    async def solve(self, problem: str, cases: List[list],
+                    method: Optional[str] = None) -> list:
+        """
+        Solves cases, each in the worker that has its index warm
+        """
+        self.start()
+        # Split the batch by worker, keeping track of where each case came from
+        shards = defaultdict(list)
+        for i, case in enumerate(cases):
+            shard = routeKey(problem, case) % len(self.executors)
+            shards[shard].append(i)
+        answers = await asyncio.gather(*(self.solveShard(
+                  shard, problem, method, [cases[i] for i in ids])
+                  for shard, ids in shards.items()))
+        results = [None] * len(cases)
+        for ids, shard_results in zip(shards.values(), answers):
+            for i, result in zip(ids, shard_results):
+                results[i] = result
+        return results
+
+    async def solveShard(self, shard: int, problem: str, method: Optional[str],
+                         cases: List[list]) -> list:
+        """
+        Solves cases in one worker, replacing it if it has died
+        """
+        loop = asyncio.get_running_loop()
+        for attempt in range(2):
+            executor = self.executors[shard]
+            try:
+                return await loop.run_in_executor(executor, solveBatch,
+                                                  problem, method, cases)
+            except BrokenExecutor:
+                # The worker died (killed for memory, or crashed), which
+                # breaks its executor for good, so start another one unless
+                # a batch that failed at the same time already has. Its
+                # indices are gone, but the next batches can still be solved
+                if self.executors[shard] is executor:
+                    executor.shutdown(wait=False)
+                    self.executors[shard] = self.startWorker()
+                    self.restarts += 1
+                # Try the batch once more, in case something else killed the
+                # worker, but report it if it kills the new one too
+                if attempt:
+                    raise
+
+    async def handle(self, request: dict) -> dict:
+        """
+        Answers one request
+        """
+        start = perf_counter()
+        response = {'id': request.get('id')}
+        if request.get('metrics'):
+            response['metrics'] = self.metrics()
+            return response
+        problem, method = request.get('problem'), request.get('method')
+        counts = self.counts[problem] if problem in MODULES else None
+        try:
+            if counts is None:
+                raise ValueError("unknown problem {0!r}".format(problem))
+            if method is not None and \
+               not(method in MODULES[problem].METHODS):
+                raise ValueError("unknown method {0!r}".format(method))
+            cases = request.get('cases', [])
+            self.in_flight += 1
+            try:
+                response['results'] = await self.solve(problem, cases, method)
+            finally:
+                self.in_flight -= 1
+            counts[0] += 1
+            counts[1] += len(cases)
+        except Exception as e:
+            response['error'] = '{0}: {1}'.format(type(e).__name__, e)
+            if counts is not None:
+                counts[2] += 1
+        if counts is not None:
+            self.latencies[problem].append(perf_counter() - start)
+        return response
+
+    async def request(self, request: dict) -> dict:
+        """
+        Answers one request once there's room for it
+        """
+        async with self.pending:
+            return await self.handle(request)
+
+    def metrics(self) -> Dict[str, object]:
+        """
+        Returns requests, cases, errors and latency percentiles of each problem
+        """
+        problems = {}
+        for problem, (requests, cases, errors) in self.counts.items():
+            latencies = sorted(self.latencies[problem])
+            problems[problem] = {'requests': requests, 'cases': cases,
+                                 'errors': errors}
+            if latencies:
+                problems[problem]['p50'] = percentile(latencies, 0.5)
+                problems[problem]['p99'] = percentile(latencies, 0.99)
+        return {'in_flight': self.in_flight, 'restarts': self.restarts,
+                'problems': problems}
+
+    async def respond(self, line: bytes, writer: asyncio.StreamWriter,
+                      lock: asyncio.Lock):
+        """
+        Answers one line of a connection, then makes room for another request
+        """
+        try:
+            try:
+                request = json.loads(line)
+                if not(isinstance(request, dict)):
+                    raise ValueError("request isn't an object")
+            except ValueError as e:
+                response = {'id': None, 'error': 'ValueError: {0}'.format(e)}
+            else:
+                response = await self.handle(request)
+            # NumPy integers from some of the methods are written as integers
+            data = json.dumps(response, default=int).encode() + b'\n'
+            async with lock:
+                writer.write(data)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.pending.release()
+
+    async def connect(self, reader: asyncio.StreamReader,
+                      writer: asyncio.StreamWriter):
+        """
+        Answers requests from a connection until it closes
+        """
+        lock, tasks = asyncio.Lock(), set()
+        try:
+            while True:
+                # Don't read another request until there's room for it, so
+                # that a client that's too fast is held up by its socket
+                await self.pending.acquire()
+                try:
+                    line = await reader.readline()
+                except (ConnectionError, ValueError):
+                    line = b''
+                except asyncio.CancelledError:
+                    self.pending.release()
+                    raise
+                if not(line.strip()):
+                    self.pending.release()
+                    if line:
+                        continue
+                    break
+                task = asyncio.create_task(self.respond(line, writer, lock))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            await asyncio.gather(*tasks)
+        except asyncio.CancelledError:
+            # Stopped by the event loop shutting down. End normally, since
+            # asyncio's streams (before Python 3.12) report a connection that
+            # ends cancelled as an unhandled error
+            for task in tasks:
+                task.cancel()
+        finally:
+            writer.close()
+
+    async def serve(self, path: str = None, host: str = '127.0.0.1',
+                    port: int = 0) -> asyncio.AbstractServer:
+        """
+        Starts serving on a Unix socket at path, or TCP on host and port
+        """
+        self.start()
+        if path:
+            return await asyncio.start_unix_server(self.connect, path,
+                                                   limit=MAX_REQUEST_BYTES)
+        return await asyncio.start_server(self.connect, host, port,
+                                          limit=MAX_REQUEST_BYTES)
+
+class LocalClient:
+    """
+    Client of a service in the same process, for tests
+    """
+
+    def __init__(self, service: SolverService):
+        self.service = service
+
+    async def request(self, request: dict) -> dict:
+        """
+        Sends a request and waits for its response
+        """
+        return await self.service.request(request)
+
+    async def solve(self, problem: str, cases: List[list],
+                    method: str = None) -> list:
+        """
+        Returns results of cases, raising RuntimeError if the request failed
+        """
+        response = await self.request({'problem': problem, 'cases': cases,
+                                       'method': method})
+        if 'error' in response:
+            raise RuntimeError(response['error'])
+        return response['results']
+
+    async def metrics(self) -> Dict[str, object]:
+        """
+        Returns the service's metrics
+        """
+        return (await self.request({'metrics': True}))['metrics']
+
+class Client(LocalClient):
+    """
+    Client of a service over a socket
+    """
+
+    def __init__(self, reader: asyncio.StreamReader,
+                 writer: asyncio.StreamWriter):
+        self.reader, self.writer = reader, writer
+        # Responses not yet received, by request id
+        self.waiting, self.next_id = {}, 0
+        self.receiver = asyncio.create_task(self.receive())
+
+    @classmethod
+    async def connect(cls, path: str = None, host: str = '127.0.0.1',
+                      port: int = 0) -> 'Client':
+        """
+        Connects to a service on a Unix socket at path, or TCP on host and port
+        """
+        if path:
+            streams = await asyncio.open_unix_connection(
+                      path, limit=MAX_REQUEST_BYTES)
+        else:
+            streams = await asyncio.open_connection(host, port,
+                                                    limit=MAX_REQUEST_BYTES)
+        return cls(*streams)
+
+    async def receive(self):
+        """
+        Hands each response to the request waiting for it
+        """
+        try:
+            async for line in self.reader:
+                response = json.loads(line)
+                future = self.waiting.pop(response['id'], None)
+                if future is not None and not(future.done()):
+                    future.set_result(response)
+        finally:
+            for future in self.waiting.values():
+                if not(future.done()):
+                    future.set_exception(ConnectionError("connection closed"))
+
+    async def request(self, request: dict) -> dict:
+        """
+        Sends a request and waits for its response
+        """
+        self.next_id += 1
+        request = dict(request, id=self.next_id)
+        future = asyncio.get_running_loop().create_future()
+        self.waiting[request['id']] = future
+        self.writer.write(json.dumps(request).encode() + b'\n')
+        await self.writer.drain()
+        return await future
+
+    async def close(self):
+        """
+        Closes the connection
+        """
+        self.writer.close()
+        await self.writer.wait_closed()
+        self.receiver.cancel()